@@ -10,8 +10,6 @@ except NameError:
     pass  # load_translations() added in calibre 1.9
 
 import os.path
-from contextlib import suppress
-from typing import Any, Dict, List
 
 try:
     from qt.core import QMenu, QToolButton
@@ -25,8 +23,9 @@ from .common_utils import GUI, PLUGIN_NAME, debug_print, get_icon, has_restart_p
 from .common_utils.dialogs import ProgressDialog, custom_exception_dialog
 from .common_utils.librarys import get_BookIds_selected
 from .common_utils.menus import create_menu_action_unique
-from .config import DYNAMIC, FIELD, ICON, KEY, plugin_check_enable_library, plugin_realy_enable
-from .container_extended_metadata import default_extended_metadata, read_extended_metadata, write_extended_metadata
+from .container_extended_metadata import NAME_MEMOS, check_name_memos, read_extended_metadata, write_extended_metadata
+from .core import ICON, KEY, current_prefs, plugin_check_enable_library, plugin_realy_enable
+from .extended_metadata import apply_extended_metadata, create_extended_metadata, wanted_extended_metadata
 
 
 class VALUE:
@@ -130,96 +129,14 @@ class ePubExtendedMetadataAction(InterfaceAction):
         ePubExtendedMetadataProgressDialog(book_ids)
 
 
-def apply_extended_metadata(miA, prefs, extended_metadata, keep_calibre=False, check_user_metadata={}) -> List[str]:
-    field_change = []
-    
-    if check_user_metadata:
-        # check if the Metadata object accepts those added
-        from calibre.ebooks.metadata import string_to_authors
-        
-        from .common_utils.columns import get_columns_from_dict
-        miA_columns = get_columns_from_dict(miA.get_all_user_metadata(True))
-        for k,cc in check_user_metadata.items():
-            if not k.startswith('#'):
-                continue
-            if not (cc.is_composite or cc.is_csp):
-                if k not in miA_columns:
-                    if cc.is_multiple:
-                        cc.metadata['#value#'] = []
-                    else:
-                        cc.metadata['#value#'] = None
-                    cc.metadata['#extra#'] = None
-                    miA.set_user_metadata(k, cc.metadata)
-                else:
-                    mc = miA_columns[k]
-                    if cc.is_multiple and not mc.is_multiple:
-                        values = []
-                        if cc.is_names:
-                            values = string_to_authors(mc.metadata['#value#'])
-                        elif mc.metadata['#value#']:
-                            values = mc.metadata['#value#'].split(cc.is_multiple.ui_to_list)
-                        
-                        cc.metadata['#value#'] = values
-                        cc.metadata['#extra#'] = None
-                        miA.set_user_metadata(k, cc.metadata)
-                    
-                    if not cc.is_multiple and mc.is_multiple:
-                        join = mc.is_multiple.list_to_ui or ', '
-                        value = join.joint(mc.metadata['#value#'])
-                        
-                        cc.metadata['#value#'] = value
-                        cc.metadata['#extra#'] = None
-                        miA.set_user_metadata(k, cc.metadata)
-    
-    contributors = extended_metadata[KEY.CONTRIBUTORS]
-    for role, field in prefs.get(KEY.CONTRIBUTORS, {}).items():
-        if field == FIELD.AUTHOR.NAME or role not in contributors:
-            continue
-        new_value = contributors[role]
-        old_value = miA.get(field)
-        if not (old_value and keep_calibre):
-            miA.set(field, new_value)
-            field_change.append(field)
-    
-    titles = extended_metadata[KEY.TITLES]
-    # overwrite the calibre behavior that merge subtitle into main-title
-    # iff a subtitle field is defined
-    if titles and prefs.get(KEY.TITLES, {}).get(FIELD.TITLES.SUBTITLE):
-        if miA.get('title') == titles[FIELD.TITLES.READ]:
-            miA.set('title', titles[FIELD.TITLES.MAIN])
-            field_change.append('title')
-    
-    for role, field in prefs.get(KEY.TITLES, {}).items():
-        if role not in titles:
-            continue
-        new_value = titles[role]
-        old_value = miA.get(field)
-        if not (old_value and keep_calibre):
-            miA.set(field, new_value)
-            field_change.append(field)
-    
-    return field_change
-
-
-def create_extended_metadata(miA, prefs) -> Dict[str, Any]:
-    extended_metadata = default_extended_metadata()
-    contributors = extended_metadata[KEY.CONTRIBUTORS]
-    titles = extended_metadata[KEY.TITLES]
-    
-    for role, field in prefs.get(KEY.CONTRIBUTORS, {}).items():
-        contributors[role] = miA.get(field, default=[])
-    
-    for role, field in prefs.get(KEY.TITLES, {}).items():
-        titles[role] = miA.get(field, default=None)
-    
-    return extended_metadata
-
-
 class ePubExtendedMetadataProgressDialog(ProgressDialog):
     
     def setup_progress(self, **kvargs):
         # prefs
-        self.prefs = KEY.get_current_prefs()
+        self.prefs = current_prefs()
+        
+        # the memos of names are shared by the whole batch
+        check_name_memos()
         
         # Count update
         self.no_epub_count = 0
@@ -287,6 +204,9 @@ class ePubExtendedMetadataProgressDialog(ProgressDialog):
         else:
             debug_print('No Extended Metadata write in selected books.')
             debug_print(f'ePub Extended Metadata execute in {self.time_execut:0.3f} seconds.', '\n')
+        
+        for memo in NAME_MEMOS:
+            debug_print(memo)
     
     def job_progress(self):
         
@@ -297,19 +217,24 @@ class ePubExtendedMetadataProgressDialog(ProgressDialog):
         import_id = {}
         import_mi = {}
         
+        # the author sorts edited in calibre, fetched once for the batch
+        author_sort_map = {}
+        if VALUE.EMBED in self.book_ids.values():
+            author_sort_map = {a['name']:a['sort'] for a in self.dbAPI.author_data().values()}
+        
         export_id = []
         no_epub_id = []
         
         def perform_import(book_id, book_info, miA, fmt, path):
             if book_id not in import_mi:
                 debug_print('Read ePub Extended Metadata for', book_info, '\n')
-                extended_metadata = read_extended_metadata(path)
+                extended_metadata = read_extended_metadata(path, *wanted_extended_metadata(self.prefs))
                 # try:
                 import_id[book_id] = apply_extended_metadata(
                     miA,
                     self.prefs,
                     extended_metadata,
-                    keep_calibre=DYNAMIC[KEY.KEEP_CALIBRE_MANUAL],
+                    keep_calibre=self.prefs.keep_calibre_manual,
                 )
                 if import_id[book_id]:
                     import_mi[book_id] = miA
@@ -325,7 +250,8 @@ class ePubExtendedMetadataProgressDialog(ProgressDialog):
             
             # try:
             extended_metadata = create_extended_metadata(miA, self.prefs)
-            write_extended_metadata(path, extended_metadata)
+            if not write_extended_metadata(path, extended_metadata, author_sort_map=author_sort_map):
+                return
             export_id.append(book_id)
             new_size = os.path.getsize(path)
             if new_size is not None:
@@ -390,59 +316,3 @@ class ePubExtendedMetadataProgressDialog(ProgressDialog):
         
         lst_id = list(import_id.keys()) + export_id
         GUI.iactions['Edit Metadata'].refresh_gui(lst_id, covers_changed=False)
-
-
-####
-# Enter the exotic zone
-# those of the integrated plugins that if you don't watch out, overide those of Calibre => no basic metadata.
-
-#   get_metadata(stream, type)
-def read_metadata(stream, fmt, miA):
-    # ---------------
-    # Read Extended Metadata
-    extended_metadata = read_extended_metadata(stream)
-    apply_extended_metadata(miA, KEY.get_current_prefs(), extended_metadata,
-                        keep_calibre=DYNAMIC[KEY.KEEP_CALIBRE_AUTO], check_user_metadata=KEY.get_current_columns())
-    return miA
-
-
-# ePubExtendedMetadata.MetadataWriter
-#   set_metadata(stream, mi, type)
-def write_metadata(stream, fmt, miA):
-    import sys
-    import traceback
-    
-    # ---------------
-    # Write Extended Metadata
-    from calibre.customize.builtins import ActionEmbed
-    from calibre.customize.ui import find_plugin
-    
-    i = None
-    book_ids = None
-    pd = None
-    only_fmts = None
-    errors = None
-    report_error = None
-    
-    action_embed = find_plugin(ActionEmbed.name).actual_plugin_
-    job_data = getattr(action_embed, 'job_data', None)
-    if action_embed and job_data:
-        with suppress(Exception):
-            i, book_ids, pd, only_fmts, errors = job_data
-            def report_error(mi, fmt, tb):
-                miA.book_id = book_ids[i]
-                errors.append((miA, fmt, tb))
-    
-    try:
-        extended_metadata = create_extended_metadata(miA, KEY.get_current_prefs())
-        write_extended_metadata(stream, extended_metadata)
-    except:
-        if report_error is None:
-            debug_print(
-                'Failed to set extended metadata for the', fmt.upper(),
-                'format of:', getattr(miA, 'title', ''),
-                file=sys.stderr,
-            )
-            traceback.print_exc()
-        else:
-            report_error(miA, fmt.upper(), traceback.format_exc())
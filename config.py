@@ -9,7 +9,6 @@ try:
 except NameError:
     pass  # load_translations() added in calibre 1.9
 
-import copy
 from collections import OrderedDict
 from functools import partial
 
@@ -49,196 +48,15 @@ except ImportError:
     )
 
 from calibre.gui2 import question_dialog, warning_dialog
-from calibre.library.field_metadata import FieldMetadata
 from calibre.utils.icu import strcmp
 
-from .common_utils import GUI, PREFS_dynamic, PREFS_library, debug_print, duplicate_entry, get_icon
+from .common_utils import GUI, debug_print, duplicate_entry, get_icon
 from .common_utils.dialogs import KeyboardConfigDialogButton, LibraryPrefsViewerDialogButton
 from .common_utils.widgets import CustomColumnComboBox, ImageTitleLayout, KeyValueComboBox, ReadOnlyTableWidgetItem
+from .core import FIELD, ICON, KEY, PREFS, plugin_check_enable_library, plugin_realy_enable
 from .marc_relators import CONTRIBUTORS_DESCRIPTION, CONTRIBUTORS_ROLES
 
 
-class ICON:
-    PLUGIN    = 'images/plugin.png'
-    WARNING   = 'images/warning.png'
-
-
-class FIELD:
-    '''
-    contains the information to associate the data to a field
-    '''
-    class AUTHOR:
-        ROLE = 'aut'
-        NAME = 'authors'
-        LOCAL = FieldMetadata()._tb_cats['authors']['name']
-        COLUMN = f'{NAME} ({LOCAL})'
-    
-    class TITLES:
-        READ = ':read:'
-        MAIN = 'main'
-        SUBTITLE = 'subtitle'
-        SHORT = 'short'
-        EDITION = 'edition'
-        EXPANDED = 'expanded'
-        COLLECTION = 'collection'
-
-
-class KEY:
-    OPTION_CHAR = '_'
-    AUTO_IMPORT = OPTION_CHAR + 'autoImport'
-    AUTO_EMBED = OPTION_CHAR + 'autoEmbed'
-    FIRST_CONFIG = OPTION_CHAR + 'firstConfig'
-    LINK_AUTHOR = OPTION_CHAR + 'linkAuthors'
-    CREATORS_AS_AUTHOR = OPTION_CHAR + 'creatorAsAuthors'
-    
-    KEEP_CALIBRE_MANUAL = OPTION_CHAR + 'keepCalibre_Manual'
-    KEEP_CALIBRE_AUTO = OPTION_CHAR + 'keepCalibre_Auto'
-    
-    SHARED_COLUMNS = OPTION_CHAR + 'sharedColumns'
-    
-    CREATORS = 'creators'
-    CONTRIBUTORS = 'contributors'
-    
-    # legacy ePub2
-    COVERAGES = 'coverages'
-    RELATIONS = 'relations'
-    RIGHTS = 'rights'
-    SOURCES = 'sources'
-    TYPES = 'types'
-    
-    # ePub3
-    SERIES = 'series'
-    COLLECTIONS = 'collections'
-    TITLES = 'titles'
-    
-    @staticmethod
-    def find_plugin(key):
-        from calibre.customize.ui import find_plugin
-        
-        from .common_utils import PLUGIN_CLASSE
-        return find_plugin(PLUGIN_CLASSE.name_writer if key == KEY.AUTO_EMBED else PLUGIN_CLASSE.name_reader)
-    
-    @staticmethod
-    def enable_plugin(key):
-        from calibre.customize.ui import enable_plugin
-        p = KEY.find_plugin(key)
-        if p:
-            enable_plugin(p.name)
-    
-    @staticmethod
-    def disable_plugin(key):
-        from calibre.customize.ui import disable_plugin
-        p = KEY.find_plugin(key)
-        if p:
-            disable_plugin(p.name)
-    
-    @staticmethod
-    def get_current_columns():
-        from .common_utils.columns import get_columns_from_dict
-        return get_columns_from_dict(DYNAMIC[KEY.SHARED_COLUMNS])
-    
-    @staticmethod
-    def get_current_prefs():
-        prefs = DYNAMIC.copy()
-        current_columns = KEY.get_current_columns().keys()
-        
-        prefs = {k:v for k, v in prefs.items() if not k.startswith(KEY.OPTION_CHAR)}
-        
-        if KEY.CONTRIBUTORS not in prefs or not prefs[KEY.CONTRIBUTORS]:
-            prefs[KEY.CONTRIBUTORS] = {}
-        if KEY.TITLES not in prefs or not prefs[KEY.TITLES]:
-            prefs[KEY.TITLES] = {}
-        
-        for k,v in copy.copy(prefs).items():
-            if k == KEY.CONTRIBUTORS:
-                for k,v in copy.copy(prefs[KEY.CONTRIBUTORS]).items():
-                    if not k or k not in CONTRIBUTORS_ROLES or not v or v not in current_columns:
-                        prefs[KEY.CONTRIBUTORS].pop(k, None)
-            elif k == KEY.TITLES:
-                for k,v in copy.copy(prefs[KEY.TITLES]).items():
-                    if not v or v not in current_columns:
-                        prefs[KEY.TITLES].pop(k, None)
-            elif not v or v not in current_columns:
-                prefs.pop(k, None)
-        
-        if DYNAMIC[KEY.LINK_AUTHOR]:
-            prefs[KEY.CONTRIBUTORS][FIELD.AUTHOR.ROLE] = FIELD.AUTHOR.NAME
-        return prefs
-    
-    @staticmethod
-    def get_names():
-        from .common_utils.columns import get_names
-        return get_names(True)
-    
-    @staticmethod
-    def get_title():
-        from .common_utils.columns import get_title
-        return get_title(True)
-    
-    @staticmethod
-    def get_used_columns():
-        from .common_utils.columns import get_columns_where
-        treated_column = set()
-        treated_column.update(v for k,v in PREFS.items() if not k.startswith(KEY.OPTION_CHAR) and isinstance(v, str))
-        treated_column.update(c for c in PREFS[KEY.CONTRIBUTORS].values() if isinstance(c, str))
-        treated_column.update(c for c in PREFS[KEY.TITLES].values() if isinstance(c, str))
-        
-        def predicate(column):
-            return column.is_custom and column.name in treated_column
-        
-        return {v.name:v.metadata for v in get_columns_where(predicate=predicate).values()}
-
-
-PREFS = PREFS_library()
-PREFS.defaults[KEY.AUTO_IMPORT] = False
-PREFS.defaults[KEY.AUTO_EMBED] = False
-PREFS.defaults[KEY.LINK_AUTHOR] = False
-PREFS.defaults[KEY.CREATORS_AS_AUTHOR] = False
-PREFS.defaults[KEY.CONTRIBUTORS] = {}
-PREFS.defaults[KEY.FIRST_CONFIG] = True
-PREFS.defaults[KEY.KEEP_CALIBRE_MANUAL] = False
-PREFS.defaults[KEY.KEEP_CALIBRE_AUTO] = True
-PREFS.defaults[KEY.TITLES] = {
-    FIELD.TITLES.SUBTITLE: '',
-    FIELD.TITLES.SHORT: '',
-    FIELD.TITLES.EDITION: '',
-    FIELD.TITLES.EXPANDED: '',
-    FIELD.TITLES.COLLECTION: '',
-}
-
-DYNAMIC = PREFS_dynamic()
-DYNAMIC.defaults = copy.deepcopy(PREFS.defaults)
-DYNAMIC.defaults[KEY.SHARED_COLUMNS] = {}
-
-
-def plugin_check_enable_library():
-    if PREFS[KEY.AUTO_IMPORT]:
-        KEY.enable_plugin(KEY.AUTO_IMPORT)
-    else:
-        KEY.disable_plugin(KEY.AUTO_IMPORT)
-    
-    if PREFS[KEY.AUTO_EMBED]:
-        KEY.enable_plugin(KEY.AUTO_EMBED)
-    else:
-        KEY.disable_plugin(KEY.AUTO_EMBED)
-    
-    with DYNAMIC:
-        DYNAMIC.update(PREFS.copy())
-        DYNAMIC[KEY.SHARED_COLUMNS] = KEY.get_used_columns()
-
-
-def plugin_realy_enable(key):
-    from calibre.customize.ui import is_disabled
-    p = KEY.find_plugin(key)
-    if p:
-        enable = not is_disabled(p)
-        if PREFS[key] != enable:
-            PREFS[key] = enable
-        return enable
-    else:
-        return False
-
-
 class ConfigWidget(QWidget):
     def __init__(self):
         QWidget.__init__(self)
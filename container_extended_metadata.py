@@ -10,27 +10,26 @@ except NameError:
     pass  # load_translations() added in calibre 1.9
 
 import os
-from collections import defaultdict
+import re
+import sys
+from collections import OrderedDict, defaultdict
+from contextlib import suppress
+from io import BytesIO
+from types import MappingProxyType
 
 from lxml import etree
 
 from calibre.ebooks.metadata import author_to_author_sort, string_to_authors, title_sort
 from calibre.ebooks.metadata.epub import EPubException, get_zip_reader
-from calibre.ebooks.metadata.opf2 import OPF
-from calibre.ebooks.metadata.opf3 import (
-    find_main_title,
-    find_subtitle,
-    normalize_whitespace,
-    properties_for_id,
-    read_prefixes,
-    read_refines,
-    read_title,
-)
-from calibre.ebooks.metadata.utils import pretty_print_opf
-from calibre.utils.zipfile import ZIP_DEFLATED, ZipFile, safe_replace
+from calibre.ebooks.metadata.opf3 import normalize_whitespace
+from calibre.ebooks.metadata.utils import parse_opf, parse_opf_version, pretty_print_opf
+from calibre.utils.config import tweaks
+from calibre.utils.localization import canonicalize_lang
+from calibre.utils.xml_parse import safe_xml_fromstring
+from calibre.utils.zipfile import safe_replace
 
-from .common_utils import debug_print
-from .config import FIELD, KEY
+from .core import FIELD, KEY, debug_print
+from .epub_archive import ArchiveError, EPubArchive, MemberTooLarge
 
 NS_OCF = 'urn:oasis:names:tc:opendocument:xmlns:container'
 NS_OPF = 'http://www.idpf.org/2007/opf'
@@ -39,6 +38,135 @@ NS_NCX = 'http://www.daisy.org/z3986/2005/ncx/'
 
 NAMESPACES={'opf':NS_OPF, 'dc':NS_DC, 'ocf':NS_OCF, 'ncx':NS_NCX}
 
+OPF_ROLE = f'{{{NS_OPF}}}role'
+OPF_FILE_AS = f'{{{NS_OPF}}}file-as'
+OPF_META = f'{{{NS_OPF}}}meta'
+
+
+def XPath(expr):
+    return etree.XPath(expr, namespaces=NAMESPACES)
+
+
+class XPATH:
+    '''
+    XPath compiled once, evaluated on the <package> (ROOT_*) or on the <metadata>
+    '''
+    ROOT_METADATA = XPath('./opf:metadata')
+    ROOT_METADATA_NO_NS = XPath('./*[local-name()="metadata"]')
+    ROOT_IDS = XPath('//@id')
+    
+    ROOTFILES = XPath('//*[local-name()="rootfile" and @full-path]')
+    
+    TITLES = XPath('dc:title')
+    LANGUAGES = XPath('dc:language')
+    CREATORS = XPath('dc:creator')
+    CONTRIBUTORS = XPath('dc:contributor')
+    
+    REFINES = XPath('opf:meta[@refines]')
+
+
+OCF_CONTAINER_PATH = 'META-INF/container.xml'
+OPF_MIMETYPE = 'application/oebps-package+xml'
+
+# the <package> is expected at the start of the OPF
+PEEK_SIZE = 4096
+# maximum size of the OPF read in streaming before the end of the <metadata>
+MAX_METADATA_SIZE = 8 * 1024 * 1024
+PACKAGE_VERSION = re.compile(rb'<(?:[\w.-]+:)?package\b[^>]*?\sversion\s*=\s*([\'"])([^\'"]*)\1')
+METADATA_END = re.compile(rb'</(?:[\w.-]+:)?metadata\s*>')
+# size of the chunks of the OPF searched by scan_metadata()
+SCAN_CHUNK_SIZE = 16 * 1024
+
+# markers of the extended metadata, searched in the raw OPF before any parsing
+ROLE_MARKER = b'role'
+TITLE_TYPE_MARKER = b'title-type'
+
+
+# size of the memo of each name transform
+NAME_MEMO_SIZE = 4096
+
+
+class NameMemo:
+    '''
+    Bounded LRU memo of a name transform, keyed by the text and the language
+    
+    The memo is cleared by check_tweaks() if one of the tweaks used by the transform has changed
+    '''
+    def __init__(self, name, func, tweaks_names=(), size=NAME_MEMO_SIZE):
+        self.name = name
+        self.func = func
+        self.tweaks_names = tweaks_names
+        self.size = size
+        self._cache = OrderedDict()
+        self._tweaks = self._tweaks_signature()
+        self.hits = 0
+        self.misses = 0
+    
+    def __call__(self, text, lang=None):
+        key = (text, lang)
+        try:
+            rslt = self._cache[key]
+        except KeyError:
+            self.misses += 1
+            rslt = self.func(text) if lang is None else self.func(text, lang=lang)
+            self._cache[key] = rslt
+            if len(self._cache) > self.size:
+                self._cache.popitem(last=False)
+        else:
+            self.hits += 1
+            self._cache.move_to_end(key)
+        return rslt
+    
+    def _tweaks_signature(self):
+        return tuple(repr(tweaks.get(name)) for name in self.tweaks_names)
+    
+    def check_tweaks(self):
+        tweaks_signature = self._tweaks_signature()
+        if tweaks_signature != self._tweaks:
+            self.clear()
+            self._tweaks = tweaks_signature
+    
+    def clear(self):
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+    
+    def __str__(self):
+        return f'{self.name}: {self.hits} hits, {self.misses} misses ({self.hit_rate:.0%})'
+
+
+AUTHOR_SORT_MEMO = NameMemo('author_to_author_sort', author_to_author_sort, (
+    'author_sort_copy_method',
+    'author_name_suffixes',
+    'author_name_prefixes',
+    'author_name_copywords',
+    'author_use_surname_prefixes',
+    'author_surname_prefixes',
+))
+TITLE_SORT_MEMO = NameMemo('title_sort', title_sort, (
+    'title_series_sorting',
+    'per_language_title_sort_articles',
+    'default_language_for_title_sort',
+))
+# tuple, to not share a mutable list
+STRING_TO_AUTHORS_MEMO = NameMemo('string_to_authors', lambda text: tuple(string_to_authors(text)), (
+    'authors_split_regex',
+))
+NAME_MEMOS = (AUTHOR_SORT_MEMO, TITLE_SORT_MEMO, STRING_TO_AUTHORS_MEMO)
+
+
+def check_name_memos():
+    '''
+    Clear the name memos whose tweaks have changed, to call at the start of a batch
+    '''
+    for memo in NAME_MEMOS:
+        memo.check_tweaks()
+
 
 class ParseError(ValueError):
     def __init__(self, name, err):
@@ -59,53 +187,236 @@ class OPFParseError(OPFException, ParseError):
 class ContainerExtendedMetadata:
     '''
     epub can be a file path or a stream
+    
+    Only the container.xml and the OPF are decompressed,
+    located with the central directory of the ZIP.
+    The OPF is parsed at the first access to root or metadata,
+    and a file path is opened in write mode only when save_opf() is called.
+    
+    zip_reader is a calibre ZIP reader (get_zip_reader()) already open on the epub stream,
+    its parsed OPF is used as it is.
     '''
-    def __init__(self, epub, read_only=False):
-        # Load ZIP
-        self.ZIP = None
-        self.reader = None
-        self._opf = None
+    def __init__(self, epub, read_only=False, zip_reader=None):
+        self.read_only = read_only
+        self.archive = None
+        self.opf_path = None
+        self._root = None
+        self._metadata = None
+        self._version = None
+        self._extended_metadata = None
+        self._path = None
+        self._file = None
         
-        self.ZIP = ZipFile(epub, mode='r' if read_only else 'a', compression=ZIP_DEFLATED)
-        self.reader = get_zip_reader(self.ZIP.fp, root=os.getcwd())
-        self._opf = self.reader.opf
-            
-        import math
-        d, i = math.modf(self.opf.package_version)
-        self._version = (int(i), int(d))
+        if hasattr(epub, 'read'):
+            self.stream = epub
+        else:
+            self._path = epub
+            self.stream = self._file = open(epub, 'rb')
+        
+        if zip_reader is not None:
+            self._use_zip_reader(zip_reader)
+            return
+        
+        try:
+            self.archive = EPubArchive(self.stream)
+            try:
+                container_xml = self.archive.read(OCF_CONTAINER_PATH)
+            except KeyError:
+                raise OPFException('missing OCF container.xml file')
+            opf_path = find_opf_path(container_xml)
+            try:
+                self.opf_path = self.archive.getmember(opf_path).filename
+            except KeyError:
+                raise OPFException(f'missing OPF package file: {opf_path}')
+        except ArchiveError as err:
+            self._fallback_reader(err)
     
-    @property
-    def opf(self):
-        return self._opf
+    def _fallback_reader(self, err):
+        # broken or exotic ZIP, let calibre do its best
+        debug_print('Fallback to the calibre ZIP reader:', err)
+        self.stream.seek(0)
+        self._use_zip_reader(get_zip_reader(self.stream, root=os.getcwd()))
+    
+    def _use_zip_reader(self, reader):
+        self.archive = None
+        self.opf_path = reader.container[OPF_MIMETYPE]
+        self._set_root(reader.opf.root)
+    
+    def _set_root(self, root):
+        self._root = root
+        metadata = XPATH.ROOT_METADATA(root)
+        if not metadata:
+            # OPF without namespace
+            metadata = XPATH.ROOT_METADATA_NO_NS(root)
+        if metadata:
+            self._metadata = metadata[0]
+    
+    def _parse_opf(self):
+        if self.read_only and self._iterparse_opf():
+            return
+        try:
+            raw = self.archive.read(self.opf_path)
+        except ArchiveError as err:
+            self._fallback_reader(err)
+            return
+        try:
+            self._set_root(parse_opf(BytesIO(raw)))
+        except Exception as err:
+            raise OPFParseError(self.opf_path, err)
+    
+    def _iterparse_opf(self):
+        '''
+        Parse the OPF in streaming and stop at the end of the <metadata>,
+        the manifest and the spine are never decompressed nor parsed.
+        The resulting root only contains the <metadata>.
+        
+        Return False if the OPF need to be parsed normally (broken XML, no namespace, DOCTYPE, entities...)
+        '''
+        reader = self.archive.open(self.opf_path, limit=MAX_METADATA_SIZE)
+        in_metadata = False
+        try:
+            for event, elem in etree.iterparse(
+                reader, events=('start', 'end'), tag=(f'{{{NS_OPF}}}metadata', 'metadata'),
+                resolve_entities=False, no_network=True, load_dtd=False,
+            ):
+                if elem.tag == 'metadata':
+                    # no namespace, don't stream the whole OPF for nothing
+                    return False
+                if event == 'start':
+                    if elem.getroottree().docinfo.doctype:
+                        # the entities of a DTD are not resolved, let calibre clean it
+                        return False
+                    in_metadata = True
+                    continue
+                if next(elem.iter(etree.Entity), None) is not None:
+                    return False
+                self._root = elem.getroottree().getroot()
+                self._metadata = elem
+                return True
+        except MemberTooLarge as err:
+            if in_metadata:
+                raise OPFParseError(self.opf_path, err)
+            # the <metadata> is not in the limit, if any
+            debug_print('Failed to stream the OPF:', err)
+        except ArchiveError as err:
+            debug_print('Failed to stream the OPF:', err)
+        except etree.XMLSyntaxError as err:
+            # entities, encoding... let calibre clean it
+            debug_print('Failed to stream the OPF:', err)
+        finally:
+            reader.close()
+        return False
+    
+    def _peek_version(self):
+        '''
+        Read the version attribute of the <package> from the start of the OPF, without parsing it
+        '''
+        try:
+            reader = self.archive.open(self.opf_path)
+            head = reader.read(PEEK_SIZE)
+            reader.close()
+        except ArchiveError:
+            return None
+        match = PACKAGE_VERSION.search(head)
+        if match:
+            return match.group(2).decode('ascii', errors='replace')
+        return None
+    
+    def scan_metadata(self, markers):
+        '''
+        Search the markers (bytes) in the raw OPF up to the end of the <metadata>, without parsing it
+        
+        Return the set of the markers found, or None if the OPF is not worth or not safe to scan
+        (already parsed, read by calibre, not encoded in a superset of ASCII)
+        '''
+        if self._root is not None or self.archive is None:
+            return None
+        overlap = max(len(m) for m in markers) + 64
+        found = set()
+        data = b''
+        try:
+            reader = self.archive.open(self.opf_path, limit=MAX_METADATA_SIZE)
+            try:
+                while len(found) < len(markers):
+                    chunk = reader.read(SCAN_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    if not data and (b'\x00' in chunk or chunk.startswith((b'\xff\xfe', b'\xfe\xff'))):
+                        # UTF-16/32
+                        return None
+                    data = data[-overlap:] + chunk
+                    found.update(m for m in markers if m in data)
+                    if METADATA_END.search(data):
+                        break
+            finally:
+                reader.close()
+        except ArchiveError:
+            return None
+        return found
     
     @property
     def root(self):
-        return self._opf.root
+        if self._root is None:
+            self._parse_opf()
+        return self._root
     
     @property
     def metadata(self):
-        return self.opf.metadata
+        if self._root is None:
+            self._parse_opf()
+        return self._metadata
     
     @property
     def languages(self):
-        return self.opf.languages
+        rslt = []
+        for lang in XPATH.LANGUAGES(self.metadata):
+            lang = canonicalize_lang((lang.text or '').strip())
+            if lang:
+                rslt.append(lang)
+        return rslt
+    
+    @property
+    def extended_metadata(self):
+        '''
+        The ExtendedMetadata of the OPF, extracted once per container
+        '''
+        if self._extended_metadata is None:
+            self._extended_metadata = _read_extended_metadata(self)
+        return self._extended_metadata
     
     @property
     def version(self):
+        if self._version is None:
+            version = None
+            if self._root is None:
+                version = self._peek_version()
+            if version is None:
+                version = self.root.get('version')
+            self._version = tuple(parse_opf_version(version))
         return self._version
     
     def __enter__(self):
         return self
     
+    def _open_writable(self):
+        if self.read_only:
+            raise OPFException('The ePub was opened as read only')
+        if self._path and self._file and 'r+' not in self._file.mode:
+            self._file.close()
+            self.stream = self._file = open(self._path, 'r+b')
+            if self.archive:
+                self.archive.stream = self.stream
+    
     def save_opf(self):
-        pretty_print_opf(self.opf.root)
-        xml_opf = etree.tostring(self.opf.root, encoding='UTF-8', pretty_print=True)
+        pretty_print_opf(self.root)
+        xml_opf = etree.tostring(self.root, encoding='UTF-8', pretty_print=True)
         
-        if self.reader:
-            if isinstance(xml_opf, bytes):
-                safe_replace(self.ZIP.fp, self.reader.container[OPF.MIMETYPE], xml_opf)
-            else:
-                safe_replace(self.ZIP.fp, self.reader.container[OPF.MIMETYPE], xml_opf.encode('utf-8'))
+        self._open_writable()
+        if self.archive:
+            # only the OPF is rewritten, the others members don't move
+            self.archive.replace(self.opf_path, xml_opf)
+        else:
+            safe_replace(self.stream, self.opf_path, xml_opf)
     
     def __exit__(self, type, value, traceback):
         self.close()
@@ -114,10 +425,29 @@ class ContainerExtendedMetadata:
         self.close()
     
     def close(self):
-        self.ZIP.close()
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+def find_opf_path(container_xml):
+    '''
+    Return the path of the OPF declared in the META-INF/container.xml
+    '''
+    root = safe_xml_fromstring(container_xml)
+    rootfiles = XPATH.ROOTFILES(root)
+    for rootfile in rootfiles:
+        if rootfile.get('media-type') == OPF_MIMETYPE:
+            return rootfile.get('full-path')
+    if rootfiles:
+        return rootfiles[0].get('full-path')
+    raise OPFException('missing OPF package file entry in container')
 
 
 def default_extended_metadata():
+    '''
+    Empty extended metadata in the dict shape, see ExtendedMetadata.from_dict()
+    '''
     rslt = {}
     rslt[KEY.CREATORS] = []
     rslt[KEY.CONTRIBUTORS] = defaultdict(list)
@@ -125,255 +455,796 @@ def default_extended_metadata():
     return rslt
 
 
-def find_title_role(root, refines, role):
-    for title in root.xpath('./opf:metadata/dc:title', namespaces=NAMESPACES):
+class ExtendedMetadata:
+    '''
+    The extended metadata of a ePub: the creators, the contributors by role, the titles by type
+    and the values of the others fields (KEY in FIELDS_KEYS)
+    
+    Immutable (read-only mappings of tuples of names, interned roles), so it can be hashed
+    and compared for change detection and pickled compactly. The KEY.* items give a copy
+    in the former dict shape.
+    '''
+    __slots__ = ('_hash', 'contributors', 'creators', 'fields', 'titles')
+    
+    FIELDS_KEYS = (KEY.COVERAGES, KEY.RELATIONS, KEY.RIGHTS, KEY.SOURCES, KEY.TYPES, KEY.SERIES, KEY.COLLECTIONS)
+    
+    def __init__(self, creators=(), contributors=None, titles=None, fields=None):
+        self.creators = tuple(creators or ())
+        self.contributors = MappingProxyType(
+            {sys.intern(role):tuple(names or ()) for role, names in (contributors or {}).items()},
+        )
+        self.titles = MappingProxyType({sys.intern(role):title for role, title in (titles or {}).items()})
+        self.fields = MappingProxyType({key:tuple(values) for key, values in (fields or {}).items() if values})
+        self._hash = None
+    
+    @classmethod
+    def from_dict(cls, extended_metadata):
+        if isinstance(extended_metadata, cls):
+            return extended_metadata
+        return cls(
+            extended_metadata.get(KEY.CREATORS),
+            extended_metadata.get(KEY.CONTRIBUTORS),
+            extended_metadata.get(KEY.TITLES),
+            {key:extended_metadata.get(key) for key in cls.FIELDS_KEYS},
+        )
+    
+    def __getitem__(self, key):
+        if key == KEY.CREATORS:
+            return list(self.creators)
+        if key == KEY.CONTRIBUTORS:
+            return defaultdict(list, {role:list(names) for role, names in self.contributors.items()})
+        if key == KEY.TITLES:
+            return dict(self.titles)
+        if key in self.FIELDS_KEYS:
+            return list(self.fields.get(key, ()))
+        raise KeyError(key)
+    
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def _key(self):
+        return (
+            self.creators,
+            frozenset(self.contributors.items()),
+            frozenset(self.titles.items()),
+            frozenset(self.fields.items()),
+        )
+    
+    def __eq__(self, other):
+        if not isinstance(other, ExtendedMetadata):
+            return NotImplemented
+        return self is other or self._key() == other._key()
+    
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(self._key())
+        return self._hash
+    
+    def __reduce__(self):
+        return (ExtendedMetadata, (self.creators, dict(self.contributors), dict(self.titles), dict(self.fields)))
+    
+    def __repr__(self):
+        return (
+            f'ExtendedMetadata(creators={self.creators!r}, contributors={dict(self.contributors)!r}, '
+            f'titles={dict(self.titles)!r}, fields={dict(self.fields)!r})'
+        )
+
+
+class RefinesIndex:
+    '''
+    The <meta refines="#id"> of a <metadata>, grouped by id then by property,
+    built in one pass over the <metadata> (or filled with add() if None)
+    '''
+    def __init__(self, metadata=None):
+        self._index = defaultdict(lambda: defaultdict(list))
+        if metadata is not None:
+            for meta in XPATH.REFINES(metadata):
+                self.add(meta)
+    
+    @staticmethod
+    def _id(meta):
+        refines = meta.get('refines') or ''
+        return refines[1:] if refines.startswith('#') else None
+    
+    def add(self, meta):
+        id = self._id(meta)
+        if id:
+            self._index[id][meta.get('property')].append(meta)
+    
+    def remove(self, meta):
+        '''
+        Remove the meta of the index, not of the tree
+        '''
+        id = self._id(meta)
+        if id in self._index:
+            with suppress(ValueError):
+                self._index[id][meta.get('property')].remove(meta)
+    
+    def get(self, id, property, scheme=None):
+        if id not in self._index:
+            return []
+        rslt = self._index[id].get(property, [])
+        if scheme is not None:
+            rslt = [m for m in rslt if m.get('scheme') == scheme]
+        return list(rslt)
+    
+    def values(self, property):
+        '''
+        The text of all the meta of the property, whatever the id they refine
+        '''
+        rslt = []
+        for properties in self._index.values():
+            rslt.extend((m.text or '').strip() for m in properties.get(property, []))
+        return rslt
+    
+    def all(self, id, exclude=None):
+        '''
+        All the meta that refines the id, except those of the property exclude
+        '''
+        if id not in self._index:
+            return []
+        rslt = []
+        for property, metas in self._index[id].items():
+            if property != exclude:
+                rslt.extend(metas)
+        return rslt
+
+
+def find_titles(titles, index):
+    '''
+    One pass over the dc:title, the same titles as find_main_title() and find_subtitle() of calibre
+    
+    Return the first title of each title-type, the main title and the subtitle
+    '''
+    by_type = {}
+    first_title = main_title = subtitle = None
+    for title in titles:
         if not title.text or not title.text.strip():
             continue
-        props = properties_for_id(title.get('id'), refines)
-        if props.get('title-type') == role:
-            return title
+        # like properties_for_id(), the last non-empty value
+        title_type = ''
+        for meta in index.get(title.get('id'), 'title-type'):
+            title_type = (meta.text or '').strip() or title_type
+        
+        if first_title is None:
+            first_title = title
+        if main_title is None and title_type == FIELD.TITLES.MAIN:
+            main_title = title
+        if subtitle is None and ('subtitle' in title_type or 'sub-title' in title_type):
+            subtitle = title
+        if title_type:
+            by_type.setdefault(title_type, title)
+    
+    return by_type, main_title if main_title is not None else first_title, subtitle
 
 
-def read_extended_metadata(epub):
+def read_extended_metadata(epub, roles=None, title_types=None):
     '''
-    epub/opf can be a file path or a stream
+    epub/opf can be a file path, a stream or a already open ContainerExtendedMetadata
+    
+    roles and title_types are the contributors roles and the title-types wanted (None for all),
+    if one is given only the contributors and the titles are read
     '''
-    extended_metadata = default_extended_metadata()
+    if roles is None and title_types is None:
+        if isinstance(epub, ContainerExtendedMetadata):
+            return epub.extended_metadata
+        with ContainerExtendedMetadata(epub, read_only=True) as container:
+            return container.extended_metadata
+    
+    if roles is not None and not roles and title_types is not None and not title_types:
+        return ExtendedMetadata()
+    
+    if isinstance(epub, ContainerExtendedMetadata):
+        return _read_extended_metadata(epub, roles, title_types)
     
     # Use a "stream" to read the OPF without any extracting
     with ContainerExtendedMetadata(epub, read_only=True) as container:
-        extended_metadata = _read_extended_metadata(container)
+        extended_metadata = _prefilter_extended_metadata(container, roles, title_types)
+        if extended_metadata is None:
+            extended_metadata = _read_extended_metadata(container, roles, title_types)
     
     return extended_metadata
 
 
-def write_extended_metadata(epub, extended_metadata):
+def _prefilter_extended_metadata(container, roles, title_types):
+    '''
+    The extraction of a OPF that has none of the markers needed by the wanted roles and title-types,
+    found by a bytes search without parsing it. None if the OPF must be read.
     '''
-    epub/opf can be a file path or a stream
+    if roles is None or title_types is None:
+        # all the contributors or all the titles are wanted
+        return None
+    
+    markers = set()
+    if roles:
+        if set(roles) & DEFAULT_ROLES:
+            # the creators and contributors without role
+            return None
+        markers.add(ROLE_MARKER)
+    if title_types:
+        if FIELD.TITLES.MAIN in title_types:
+            return None
+        markers.add(TITLE_TYPE_MARKER)
+    if not markers or container.scan_metadata(markers) != set():
+        return None
+    
+    titles = {}
+    if FIELD.TITLES.SUBTITLE in (title_types or ()) and container.version[0] == 3:
+        # without title-type, there is no subtitle
+        titles[FIELD.TITLES.SUBTITLE] = None
+    return ExtendedMetadata(titles=titles)
+
+
+def write_extended_metadata(epub, extended_metadata, author_sort_map=None):
+    '''
+    epub/opf can be a file path, a stream or a already open ContainerExtendedMetadata
+    
+    author_sort_map {name:sort} is used for the file-as of the new contributors,
+    the names not in it are sorted by author_to_author_sort(); the file-as of
+    the existing contributors are updated to it
+    
+    Return False if the file was left untouched, because nothing changed
     '''
     debug_print('write_extended_metadata()')
     debug_print('extended_metadata:', extended_metadata)
     
+    if isinstance(epub, ContainerExtendedMetadata):
+        return _save_extended_metadata(epub, extended_metadata, author_sort_map)
+    
     # Use a "stream" to read the OPF without any extracting
     with ContainerExtendedMetadata(epub, read_only=False) as container:
-        _write_extended_metadata(container, extended_metadata)
-        container.save_opf()
+        return _save_extended_metadata(container, extended_metadata, author_sort_map)
+
+
+def _save_extended_metadata(container, extended_metadata, author_sort_map):
+    if not _write_extended_metadata(container, extended_metadata, author_sort_map):
+        debug_print('No change of the extended metadata, the file is not rewritten')
+        return False
+    container.save_opf()
+    return True
+
+
+def _extract_names(store, element, index, version, arg, roles):
+    for author in STRING_TO_AUTHORS_MEMO(element.text):
+        store[author] = None
+
+
+def _extract_contributors(store, element, index, version, drole, roles):
+    if version == 2:
+        element_roles = [(element.get(OPF_ROLE) or '').strip() or drole]
+    else:
+        id_s = element.get('id')
+        element_roles = []
+        if id_s:
+            element_roles = [(r.text or '').strip() or drole for r in index.get(id_s, 'role', 'marc:relators')]
+        if not element_roles:
+            element_roles = [drole]
+    if roles is not None:
+        element_roles = [r for r in element_roles if r in roles]
+        if not element_roles:
+            return
+    
+    for author in STRING_TO_AUTHORS_MEMO(element.text):
+        for role in element_roles:
+            store[role][author] = None
+
+
+def _extract_text(store, element, index, version, arg, roles):
+    text = normalize_whitespace((element.text or '').strip())
+    if text:
+        store[text] = None
+
 
+def _extract_collection(store, element, index, version, series, roles):
+    # <meta property="belongs-to-collection">, a series if its "collection-type" is "series"
+    name = normalize_whitespace((element.text or '').strip())
+    if not name:
+        return
+    id_s = element.get('id')
+    types = [(m.text or '').strip() for m in index.get(id_s, 'collection-type')] if id_s else []
+    if ('series' in types) != series:
+        return
+    if series:
+        position = [(m.text or '').strip() for m in index.get(id_s, 'group-position')]
+        store[(name, position[0] or None if position else None)] = None
+    else:
+        store[name] = None
 
-def _read_extended_metadata(container):
-    extended_metadata = default_extended_metadata()
-    contributors = extended_metadata[KEY.CONTRIBUTORS]
-    titles = extended_metadata[KEY.TITLES]
+
+# the fields filled by the walk of the <metadata>:
+# KEY, tag of the element, "property" of a <meta>, versions of the OPF, extract function, its argument
+# the extract functions also receive the contributors roles wanted (None for all)
+EXTRACT_TABLE = (
+    (KEY.CREATORS, f'{{{NS_DC}}}creator', None, (2, 3), _extract_names, None),
+    (KEY.CONTRIBUTORS, f'{{{NS_DC}}}creator', None, (2, 3), _extract_contributors, 'aut'),
+    (KEY.CONTRIBUTORS, f'{{{NS_DC}}}contributor', None, (2, 3), _extract_contributors, 'oth'),
+    (KEY.COVERAGES, f'{{{NS_DC}}}coverage', None, (2, 3), _extract_text, None),
+    (KEY.RELATIONS, f'{{{NS_DC}}}relation', None, (2, 3), _extract_text, None),
+    (KEY.RIGHTS, f'{{{NS_DC}}}rights', None, (2, 3), _extract_text, None),
+    (KEY.SOURCES, f'{{{NS_DC}}}source', None, (2, 3), _extract_text, None),
+    (KEY.TYPES, f'{{{NS_DC}}}type', None, (2, 3), _extract_text, None),
+    (KEY.SERIES, OPF_META, 'belongs-to-collection', (3,), _extract_collection, True),
+    (KEY.COLLECTIONS, OPF_META, 'belongs-to-collection', (3,), _extract_collection, False),
+)
+# roles of the creators and contributors without role
+DEFAULT_ROLES = frozenset(arg for key, _, _, _, _, arg in EXTRACT_TABLE if key == KEY.CONTRIBUTORS)
+
+
+def _read_extended_metadata(container, roles=None, title_types=None):
+    '''
+    roles and title_types are the contributors roles and the title-types wanted (None for all),
+    if one is given only the contributors and the titles are read
+    '''
+    everything = roles is None and title_types is None
+    if roles is not None:
+        roles = set(roles)
+    if title_types is not None:
+        title_types = set(title_types)
     
-    if not container.opf:
-        return extended_metadata
+    version = container.version[0]
+    if version not in (2, 3) or container.metadata is None:
+        return ExtendedMetadata()
     
-    def contributors_append(role, author):
-        # we cannot use set because we want to keep the ordre
-        if author not in contributors[role]:
-            contributors[role].append(author)
+    # one walk over the <metadata>: index the refines and group the others elements by tag
+    index = RefinesIndex()
+    elements = defaultdict(list)
+    for child in container.metadata.iterchildren(tag=etree.Element):
+        if child.tag == OPF_META:
+            if child.get('refines'):
+                index.add(child)
+            else:
+                elements[(child.tag, child.get('property'))].append(child)
+        else:
+            elements[(child.tag, None)].append(child)
     
-    tag_role = (
-        ('dc:creator', 'aut'),
-        ('dc:contributor', 'oth'),
-    )
-    if container.version[0] == 2:
-        for tag, drole in tag_role:
-            for child in container.metadata.xpath(tag, namespaces=NAMESPACES):
-                tbl = child.xpath('@opf:role', namespaces=NAMESPACES)
-                role = tbl[0] if tbl else drole
-                role = role.strip() or drole
-                for author in string_to_authors(child.text):
-                    contributors_append(role, author)
+    if roles is not None and version == 3:
+        # no wanted role among the marc codes and the default roles, skip the contributors
+        present = set(index.values('role'))
+        for (key, tag, _, _, _, drole) in EXTRACT_TABLE:
+            if key == KEY.CONTRIBUTORS and elements.get((tag, None)):
+                present.add(drole)
+        if not present.intersection(roles):
+            roles = set()
     
-    if container.version[0] == 3:
-        for tag, drole in tag_role:
-            for child in container.metadata.xpath(f'{tag}[@id]', namespaces=NAMESPACES):
-                id = child.attrib['id']
-                xpath = f'opf:meta[@refines="#{id}" and @property="role" and @scheme="marc:relators"]'
-                roles = container.metadata.xpath(xpath, namespaces=NAMESPACES)
-                
-                roles = [r.text.strip() or drole for r in roles]
-                if not roles:
-                    roles = [drole]
-                
-                for author in string_to_authors(child.text):
-                    for role in roles:
-                        contributors_append(role, author)
-            
-            for child in container.metadata.xpath(f'{tag}[not(@id)]', namespaces=NAMESPACES):
-                for author in string_to_authors(child.text):
-                    contributors_append(drole, author)
-        
-        ## titles
-        prefixes, refines = read_prefixes(container.root), read_refines(container.root)
+    # ordered sets of the values (dict keep the insertion ordre), by role for the contributors
+    stores = {KEY.CREATORS: {}, KEY.CONTRIBUTORS: defaultdict(dict)}
+    for key, tag, property, versions, extract, arg in EXTRACT_TABLE:
+        if version not in versions:
+            continue
+        if not everything and (key != KEY.CONTRIBUTORS or (roles is not None and not roles)):
+            continue
+        store = stores.setdefault(key, {})
+        for element in elements.get((tag, property), []):
+            extract(store, element, index, version, arg, roles)
+    
+    contributors = {role:list(authors) for role, authors in stores.pop(KEY.CONTRIBUTORS).items()}
+    creators = list(stores.pop(KEY.CREATORS))
+    
+    titles = {}
+    if version == 3:
         def to_text(node):
             if node is None:
                 return None
             return normalize_whitespace(node.text.strip())
         
-        xpath = 'opf:meta[@refines and @property="title-type"]'
-        roles = container.metadata.xpath(xpath, namespaces=NAMESPACES)
-        roles = {r.text.strip() or drole for r in roles}
-        for role in roles:
-            titles[role] = to_text(find_title_role(container.root, refines, role))
+        by_type, main_title, subtitle = find_titles(elements.get((f'{{{NS_DC}}}title', None), []), index)
+        for role in set(index.values('title-type')):
+            if role and (title_types is None or role in title_types):
+                titles[role] = to_text(by_type.get(role))
         
-        titles[FIELD.TITLES.MAIN] = to_text(find_main_title(container.root, refines))
-        titles[FIELD.TITLES.SUBTITLE] = to_text(find_subtitle(container.root, refines))
-        titles[FIELD.TITLES.READ] = read_title(container.root, prefixes, refines)
+        if title_types is None or title_types & {FIELD.TITLES.MAIN, FIELD.TITLES.SUBTITLE}:
+            titles[FIELD.TITLES.MAIN] = to_text(main_title)
+            titles[FIELD.TITLES.SUBTITLE] = to_text(subtitle)
+            # like read_title() of calibre
+            read = None
+            if main_title is not None:
+                read = main_title.text.strip()
+                if subtitle is not None and subtitle is not main_title:
+                    read += ': ' + subtitle.text.strip()
+                read = normalize_whitespace(read)
+            titles[FIELD.TITLES.READ] = read
     
+    extended_metadata = ExtendedMetadata(creators, contributors, titles, stores)
     debug_print('extended_metadata:', extended_metadata)
     
     return extended_metadata
 
 
-def _write_extended_metadata(container, extended_metadata):
-    if not container.opf:
+def _writable_extended_metadata(contributors, titles):
+    '''
+    The values written, to compare: the empty roles and titles are not written
+    '''
+    return ExtendedMetadata(
+        contributors={role:names for role, names in contributors.items() if names},
+        titles={role:title for role, title in titles.items() if title},
+    )
+
+
+def _write_extended_metadata(container, extended_metadata, author_sort_map=None):
+    '''
+    Update the <metadata> to the extended_metadata, only the elements that differ
+    are touched and the existing ids are kept.
+    The current state is always the full extraction of the container (never a filtered read).
+    
+    Return True if the <metadata> was changed
+    '''
+    if container.metadata is None:
         return False
     
-    epub_extended_metadata = _read_extended_metadata(container)
+    epub_extended_metadata = container.extended_metadata
+    extended_metadata = ExtendedMetadata.from_dict(extended_metadata)
     
     # remove internal values
-    for role in list(epub_extended_metadata[KEY.TITLES].keys()):
-        if role.startswith(':') or role == FIELD.TITLES.MAIN:
-            epub_extended_metadata[KEY.TITLES].pop(role, None)
+    titles = {}
+    for role, title in epub_extended_metadata.titles.items():
+        if not (role.startswith(':') or role == FIELD.TITLES.MAIN):
+            titles[role] = title
     
     # pop authors role, duplicate value if LINK_AUTHOR not enable
-    epub_extended_metadata[KEY.CONTRIBUTORS].pop(FIELD.AUTHOR.ROLE, None)
+    contributors = dict(epub_extended_metadata.contributors)
+    contributors.pop(FIELD.AUTHOR.ROLE, None)
+    current = _writable_extended_metadata(contributors, titles)
     
     # merge source metadata and the new
-    for role, value in extended_metadata[KEY.CONTRIBUTORS].items():
-        epub_extended_metadata[KEY.CONTRIBUTORS][role] = value
-    for role, value in extended_metadata[KEY.TITLES].items():
-        epub_extended_metadata[KEY.TITLES][role] = value
-    
-    def get_index(tag):
-        tags = container.metadata.xpath(f'dc:{tag}', namespaces=NAMESPACES)
-        if tags:
-            return container.metadata.index(tags[-1])+1
-        return 0
-    
-    if container.version[0] == 2:
-        idx = get_index('creator')
-        for role in sorted(epub_extended_metadata[KEY.CONTRIBUTORS].keys()):
-            for meta in container.metadata.xpath(f'dc:contributor[@opf:role="{role}"]', namespaces=NAMESPACES):
-                container.metadata.remove(meta)
-            for contrib in epub_extended_metadata[KEY.CONTRIBUTORS][role]:
-                element = etree.Element(etree.QName(NS_DC, 'contributor'))
-                element.text = contrib
-                element.attrib[etree.QName(NS_OPF, 'role')] = role
-                element.attrib[etree.QName(NS_OPF, 'file-as')] = author_to_author_sort(contrib)
-                container.metadata.insert(idx, element)
-                idx = idx+1
+    contributors.update(extended_metadata.contributors)
+    titles.update(extended_metadata.titles)
+    
+    contributors = {role:list(dict.fromkeys(names)) for role, names in contributors.items()}
+    
+    # without sort to update, the same values leave the <metadata> as it is
+    if not author_sort_map and _writable_extended_metadata(contributors, titles) == current:
+        return False
+    author_sort_map = author_sort_map or {}
     
     if container.version[0] == 3:
-        ## titles
-        for title in container.metadata.xpath('dc:title', namespaces=NAMESPACES):
-            id_s = title.attrib.get('id')
-            if id_s:
-                is_main = False
-                xpath = f'opf:meta[@refines="#{id_s}" and @property="title-type"]'
-                for meta in container.metadata.xpath(xpath, namespaces=NAMESPACES):
-                    if meta.text == FIELD.TITLES.MAIN:
-                        is_main = True
-                    else:
-                        container.metadata.remove(meta)
-                if is_main:
-                    continue
-                # if the title has others meta linked (except "file-as")
-                xpath = f'opf:meta[@refines="#{id_s}" and not(@property="file-as")]'
-                if not container.metadata.xpath(xpath, namespaces=NAMESPACES):
-                    # if the title has no others meta linked (or only "file-as"), del the title
-                    container.metadata.remove(title)
-                    # and del the "file-as"
-                    for meta in container.metadata.xpath(f'opf:meta[@refines="#{id_s}"]', namespaces=NAMESPACES):
-                        container.metadata.remove(meta)
+        index = RefinesIndex(container.metadata)
+        ids = set(XPATH.ROOT_IDS(container.root))
+        edit = MetadataEdit(container.metadata)
+        changed_titles = _write_titles_opf3(container, edit, index, ids, titles)
+        changed_contributors = _write_contributors_opf3(
+            container.metadata, edit, index, ids, contributors, author_sort_map,
+        )
+        changed = changed_titles or changed_contributors
+    elif container.version[0] == 2:
+        edit = MetadataEdit(container.metadata)
+        changed = _write_contributors_opf2(container.metadata, edit, contributors, author_sort_map)
+    else:
+        changed = False
+    
+    if changed:
+        edit.apply()
+        # the extraction no longer match the tree
+        container._extended_metadata = None
+    return changed
+
+
+class MetadataEdit:
+    '''
+    The elements removed from and inserted in a <metadata>,
+    applied at once by apply() that replace all the children in one operation
+    '''
+    def __init__(self, metadata):
+        self.metadata = metadata
+        self.removed = set()
+        self._inserted = defaultdict(list)
+    
+    def remove(self, element):
+        self.removed.add(element)
+    
+    def insert_after(self, anchor, elements):
+        '''
+        Insert the elements after the anchor (a current child, removed or not),
+        or at the start of the <metadata> if None. The elements inserted after
+        the same anchor are kept in order.
+        '''
+        self._inserted[anchor].extend(elements)
+    
+    def apply(self):
+        children = list(self._inserted.get(None, []))
+        for child in self.metadata:
+            if child not in self.removed:
+                children.append(child)
+            children.extend(self._inserted.get(child, []))
+        self.metadata[:] = children
+        self.removed.clear()
+        self._inserted.clear()
+
+
+def _refines_meta(id_s, property, text, scheme=None):
+    meta = etree.Element(etree.QName(NS_OPF, 'meta'))
+    meta.text = text
+    meta.attrib['refines'] = f'#{id_s}'
+    meta.attrib['property'] = property
+    if scheme:
+        meta.attrib['scheme'] = scheme
+    return meta
+
+
+def _new_id(ids, prefix, first=None):
+    '''
+    A id not used in the OPF, first if it is free else prefix-NN
+    '''
+    if first and first not in ids:
+        ids.add(first)
+        return first
+    n = 1
+    while f'{prefix}-{n:02d}' in ids:
+        n = n+1
+    rslt = f'{prefix}-{n:02d}'
+    ids.add(rslt)
+    return rslt
+
+
+def _remove_with_refines(edit, index, element):
+    id_s = element.get('id')
+    if id_s:
+        for meta in index.all(id_s):
+            index.remove(meta)
+            edit.remove(meta)
+    edit.remove(element)
+
+
+def _single_name(contrib):
+    authors = STRING_TO_AUTHORS_MEMO(contrib.text)
+    return authors[0] if len(authors) == 1 else None
+
+
+def _author_sort(author_sort_map, author):
+    return author_sort_map.get(author) or AUTHOR_SORT_MEMO(author)
+
+
+def _write_contributors_opf2(metadata, edit, contributors, author_sort_map):
+    def role_of(contrib):
+        return (contrib.get(OPF_ROLE) or '').strip() or 'oth'
+    
+    def update_file_as(contrib):
+        # the sort edited in calibre
+        sort = author_sort_map.get(_single_name(contrib))
+        if not sort or contrib.get(OPF_FILE_AS) == sort:
+            return False
+        contrib.attrib[OPF_FILE_AS] = sort
+        return True
+    
+    all_contributors = XPATH.CONTRIBUTORS(metadata)
+    current = defaultdict(list)
+    for contrib in all_contributors:
+        current[role_of(contrib)].append(contrib)
+    
+    # the new roles go after the contributors, else after the creators
+    anchor = (all_contributors or XPATH.CREATORS(metadata) or [None])[-1]
+    
+    changed = False
+    for role in sorted(contributors.keys()):
+        elements = current.get(role, [])
+        names = []
+        for contrib in elements:
+            names.extend(STRING_TO_AUTHORS_MEMO(contrib.text))
+        if list(dict.fromkeys(names)) == contributors[role]:
+            for contrib in elements:
+                changed = update_file_as(contrib) or changed
+            continue
         
-        idx = get_index('title')
-        title_id = {}
-        if container.languages:
-            lang = container.languages[0]
-        else:
-            lang = None
+        for contrib in elements:
+            edit.remove(contrib)
+        
+        new_elements = []
+        for contrib in contributors[role]:
+            element = etree.Element(etree.QName(NS_DC, 'contributor'))
+            element.text = contrib
+            element.attrib[etree.QName(NS_OPF, 'role')] = role
+            element.attrib[OPF_FILE_AS] = _author_sort(author_sort_map, contrib)
+            new_elements.append(element)
+        # the new contributors take the place of the old
+        edit.insert_after(elements[0] if elements else anchor, new_elements)
+        changed = True
+    
+    return changed
+
+
+def _write_titles_opf3(container, edit, index, ids, titles):
+    metadata = container.metadata
+    
+    # the main title can lack of "title-type", it is never touched
+    all_titles = XPATH.TITLES(metadata)
+    _, main_title, _ = find_titles(all_titles, index)
+    
+    # the title-type of the others titles, by role
+    current = defaultdict(list)
+    for title in all_titles:
+        id_s = title.get('id')
+        if title is main_title or not id_s:
+            continue
+        metas = index.get(id_s, 'title-type')
+        if any(m.text == FIELD.TITLES.MAIN for m in metas):
+            continue
+        for meta in metas:
+            current[(meta.text or '').strip()].append((title, meta))
+    
+    def remove_role(title, meta):
+        index.remove(meta)
+        edit.remove(meta)
+        # if the title has no others meta linked (or only "file-as"), del the title and the "file-as"
+        if not index.all(title.get('id'), exclude='file-as'):
+            _remove_with_refines(edit, index, title)
+    
+    if container.languages:
+        lang = container.languages[0]
+    else:
+        lang = None
+    
+    # the new titles go after the others
+    anchor = (all_titles or [None])[-1]
+    
+    changed = False
+    for role in sorted(set(current.keys()) | set(titles.keys())):
+        text = titles.get(role)
+        entries = list(current.get(role, []))
+        if text and entries:
+            # keep the first title of this type, update its text if needed
+            title, _ = entries.pop(0)
+            if normalize_whitespace((title.text or '').strip()) != text:
+                title.text = text
+                file_as = index.get(title.get('id'), 'file-as')
+                if file_as:
+                    file_as[0].text = TITLE_SORT_MEMO(text, lang=lang)
+                else:
+                    meta = _refines_meta(title.get('id'), 'file-as', TITLE_SORT_MEMO(text, lang=lang))
+                    index.add(meta)
+                    edit.insert_after(title, [meta])
+                changed = True
+        
+        for title, meta in entries:
+            remove_role(title, meta)
+            changed = True
         
-        for role, title in sorted(epub_extended_metadata[KEY.TITLES].items()):
-            if not title:
-                continue
+        if text and not current.get(role):
+            id_s = _new_id(ids, f'title-{role}', first=f'title-{role}')
             element = etree.Element(etree.QName(NS_DC, 'title'))
-            element.text = title
-            id_s = f'title-{role}'
+            element.text = text
             element.attrib['id'] = id_s
-            container.metadata.insert(idx, element)
-            idx = idx+1
-            
-            title_id[role] = id_s
-            
-            file = etree.Element('meta')
-            file.text = title_sort(title, lang=lang)
-            file.attrib['refines'] = f'#{id_s}'
-            file.attrib['property'] = 'file-as'
-            container.metadata.insert(idx, file)
-            idx = idx+1
-        
-        for role, id_s in sorted(title_id.items()):
-            meta = etree.Element('meta')
-            meta.text = role
-            meta.attrib['refines'] = f'#{id_s}'
-            meta.attrib['property'] = 'title-type'
-            container.metadata.insert(idx, meta)
-            idx = idx+1
+            new_elements = [
+                element,
+                _refines_meta(id_s, 'file-as', TITLE_SORT_MEMO(text, lang=lang)),
+                _refines_meta(id_s, 'title-type', role),
+            ]
+            for meta in new_elements[1:]:
+                index.add(meta)
+            edit.insert_after(anchor, new_elements)
+            changed = True
+    
+    return changed
+
+
+def _in_order(elements, order):
+    '''
+    The longest subsequence of elements already sorted by order {element:position}
+    '''
+    best = []
+    for i, element in enumerate(elements):
+        previous = [best[j] for j in range(i) if order[elements[j]] < order[element]]
+        best.append(max(previous, key=len, default=[]) + [element])
+    return max(best, key=len, default=[])
+
+
+def _write_contributors_opf3(metadata, edit, index, ids, contributors, author_sort_map):
+    # the explicit marc roles of each contributor, none mean "oth" like in _read_extended_metadata
+    all_contributors = XPATH.CONTRIBUTORS(metadata)
+    roles = {}
+    by_role = defaultdict(list)
+    for contrib in all_contributors:
+        id_s = contrib.get('id')
+        metas = index.get(id_s, 'role', 'marc:relators') if id_s else []
+        roles[contrib] = {m:(m.text or '').strip() or 'oth' for m in metas}
+        for role in dict.fromkeys(roles[contrib].values() or ['oth']):
+            by_role[role].append(contrib)
+    
+    # the contributors removed, the moved ones are also in edit.removed
+    deleted = set()
+    
+    def holders(role):
+        return [c for c in by_role.get(role, []) if c not in deleted]
+    
+    name = _single_name
+    
+    def update_file_as(contrib):
+        # the sort edited in calibre
+        id_s = contrib.get('id')
+        sort = author_sort_map.get(name(contrib))
+        if not id_s or not sort:
+            return False
+        metas = index.get(id_s, 'file-as')
+        if not metas:
+            meta = _refines_meta(id_s, 'file-as', sort)
+            index.add(meta)
+            edit.insert_after(contrib, [meta])
+            return True
+        if metas[0].text == sort:
+            return False
+        metas[0].text = sort
+        return True
+    
+    def remove_role(contrib, role):
+        for meta, value in list(roles[contrib].items()):
+            if value == role:
+                index.remove(meta)
+                edit.remove(meta)
+                del roles[contrib][meta]
+        if roles[contrib]:
+            return
+        # without marc role, the contributor would be read as "oth",
+        # but the one that has others meta linked (except "file-as") is kept, like the roles of calibre
+        id_s = contrib.get('id')
+        if role == 'oth' or not id_s or not index.all(id_s, exclude='file-as'):
+            _remove_with_refines(edit, index, contrib)
+            deleted.add(contrib)
+    
+    def new_contributor(contrib):
+        id_s = _new_id(ids, role)
+        element = etree.Element(etree.QName(NS_DC, 'contributor'))
+        element.text = contrib
+        element.attrib['id'] = id_s
+        meta = _refines_meta(id_s, 'role', role, scheme='marc:relators')
+        new_elements = [
+            element,
+            _refines_meta(id_s, 'file-as', _author_sort(author_sort_map, contrib)),
+            meta,
+        ]
+        for m in new_elements[1:]:
+            index.add(m)
+        roles[element] = {meta:role}
+        return new_elements
+    
+    all_roles = set(contributors.keys()) | set(by_role.keys())
+    
+    # the new contributors go after the others, else after the creators
+    anchor = (all_contributors or XPATH.CREATORS(metadata) or [None])[-1]
+    
+    changed = False
+    for role in sorted(all_roles):
+        wanted = contributors.get(role, [])
+        elements = holders(role)
+        names = []
+        for contrib in elements:
+            names.extend(STRING_TO_AUTHORS_MEMO(contrib.text))
+        if list(dict.fromkeys(names)) == wanted:
+            for contrib in elements:
+                changed = update_file_as(contrib) or changed
+            continue
         
-        ## contributors
-        for contrib in container.metadata.xpath('dc:contributor', namespaces=NAMESPACES):
-            id_s = contrib.attrib.get('id')
-            if id_s:
-                # remove all marc code
-                xpath = f'opf:meta[@refines="#{id_s}" and @property="role" and @scheme="marc:relators"]'
-                for meta in container.metadata.xpath(xpath, namespaces=NAMESPACES):
-                    container.metadata.remove(meta)
-                # if the contributor has others meta linked (except "file-as")
-                xpath = f'opf:meta[@refines="#{id_s}" and not(@property="file-as")]'
-                if not container.metadata.xpath(xpath, namespaces=NAMESPACES):
-                    # if the contributor has no others meta linked (or only "file-as"), del the contributor
-                    container.metadata.remove(contrib)
-                    # and del the "file-as"
-                    for meta in container.metadata.xpath(f'opf:meta[@refines="#{id_s}"]', namespaces=NAMESPACES):
-                        container.metadata.remove(meta)
+        # the existing contributors are matched by name, with their ids and refines
+        kept = {}
+        for contrib in elements:
+            if name(contrib) in wanted and name(contrib) not in kept:
+                kept[name(contrib)] = contrib
             else:
-                # remove contributor without id
-                container.metadata.remove(contrib)
-        
-        idx = get_index('creator')
-        role_id = defaultdict(list)
+                remove_role(contrib, role)
         
-        for role in sorted(epub_extended_metadata[KEY.CONTRIBUTORS].keys()):
-            id_n = (len(role_id[role]) if role in role_id else 0) + 1
-            
-            for contrib in epub_extended_metadata[KEY.CONTRIBUTORS][role]:
-                element = etree.Element(etree.QName(NS_DC, 'contributor'))
-                element.text = contrib
-                id_s = role+f'-{id_n:02d}'
-                element.attrib['id'] = id_s
-                container.metadata.insert(idx, element)
-                idx = idx+1
-                
-                role_id[role].append(id_s)
-                
-                file = etree.Element('meta')
-                file.text = author_to_author_sort(contrib)
-                file.attrib['refines'] = f'#{id_s}'
-                file.attrib['property'] = 'file-as'
-                container.metadata.insert(idx, file)
-                idx = idx+1
-                
-                id_n = id_n+1
+        # the longest run already in the right order stay in place, the others are moved after it
+        order = {contrib:wanted.index(n) for n, contrib in kept.items()}
+        staying = _in_order([c for c in elements if c in order], order)
+        if staying:
+            after = staying[0].getprevious()
+        else:
+            after = elements[0] if elements else anchor
+        staying = set(staying)
         
-        for role in sorted(role_id.keys()):
-            for id_s in role_id[role]:
-                meta = etree.Element('meta')
-                meta.text = role
-                meta.attrib['refines'] = f'#{id_s}'
-                meta.attrib['property'] = 'role'
-                meta.attrib['scheme'] = 'marc:relators'
-                container.metadata.insert(idx, meta)
-                idx = idx+1
+        pending = []
+        for contrib in wanted:
+            element = kept.get(contrib)
+            if element is not None:
+                update_file_as(element)
+            if element in staying:
+                edit.insert_after(after, pending)
+                after, pending = element, []
+            elif element is not None:
+                edit.remove(element)
+                pending.append(element)
+            else:
+                pending.extend(new_contributor(contrib))
+        edit.insert_after(after, pending)
+        changed = True
+    
+    return changed
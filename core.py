@@ -0,0 +1,423 @@
+#!/usr/bin/env python
+
+__license__   = 'GPL v3'
+__copyright__ = '2021, un_pogaz <un.pogaz@gmail.com>'
+
+
+try:
+    load_translations()
+except NameError:
+    pass  # load_translations() added in calibre 1.9
+
+import copy
+from types import MappingProxyType
+
+from calibre import prints
+from calibre.constants import DEBUG
+from calibre.utils.config import JSONConfig
+
+from . import ePubExtendedMetadata
+from .marc_relators import CONTRIBUTORS_CODES
+
+# The constants and the prefs of the plugin, without any GUI import:
+# loaded by the embedded reader/writer in the calibre workers.
+# The common_utils package loads Qt and calibre.gui2, it's only imported
+# by the functions used in the GUI; the workers use ColumnInfo for the columns.
+
+PLUGIN_NAME = ePubExtendedMetadata.name
+
+
+def debug_print(*args, **kwargs):
+    if DEBUG:
+        prints('DEBUG', PLUGIN_NAME+':', *args, **kwargs)
+
+
+class ICON:
+    PLUGIN    = 'images/plugin.png'
+    WARNING   = 'images/warning.png'
+
+
+class lazy_class_attribute:
+    '''
+    class attribute computed on the first access, then replaced by its value
+    '''
+    def __init__(self, func):
+        self.func = func
+    
+    def __get__(self, instance, owner):
+        value = self.func()
+        setattr(owner, self.func.__name__, value)
+        return value
+
+
+class FIELD:
+    '''
+    contains the information to associate the data to a field
+    '''
+    class AUTHOR:
+        ROLE = 'aut'
+        NAME = 'authors'
+        
+        @lazy_class_attribute
+        def LOCAL():
+            # FieldMetadata is costly to build, only the config UI needs the localized name
+            from calibre.library.field_metadata import FieldMetadata
+            return FieldMetadata()._tb_cats['authors']['name']
+        
+        @lazy_class_attribute
+        def COLUMN():
+            return f'{FIELD.AUTHOR.NAME} ({FIELD.AUTHOR.LOCAL})'
+    
+    class TITLES:
+        READ = ':read:'
+        MAIN = 'main'
+        SUBTITLE = 'subtitle'
+        SHORT = 'short'
+        EDITION = 'edition'
+        EXPANDED = 'expanded'
+        COLLECTION = 'collection'
+
+
+class ColumnInfo:
+    '''
+    The facts about a column used by the reading, from its field metadata dict.
+    A Qt-free view for the workers, common_utils.columns loads the GUI.
+    '''
+    __slots__ = ('is_composite', 'is_csp', 'is_multiple', 'is_names', 'metadata')
+    
+    def __init__(self, metadata):
+        self.metadata = MappingProxyType(metadata)
+        self.is_composite = metadata.get('datatype') == 'composite'
+        self.is_csp = bool(metadata.get('is_csp'))
+        # the separators {cache_to_list, ui_to_list, list_to_ui}, empty if not multiple
+        self.is_multiple = MappingProxyType(metadata.get('is_multiple') or {})
+        self.is_names = bool((metadata.get('display') or {}).get('is_names'))
+
+
+class KEY:
+    OPTION_CHAR = '_'
+    AUTO_IMPORT = OPTION_CHAR + 'autoImport'
+    AUTO_EMBED = OPTION_CHAR + 'autoEmbed'
+    FIRST_CONFIG = OPTION_CHAR + 'firstConfig'
+    LINK_AUTHOR = OPTION_CHAR + 'linkAuthors'
+    CREATORS_AS_AUTHOR = OPTION_CHAR + 'creatorAsAuthors'
+    
+    KEEP_CALIBRE_MANUAL = OPTION_CHAR + 'keepCalibre_Manual'
+    KEEP_CALIBRE_AUTO = OPTION_CHAR + 'keepCalibre_Auto'
+    
+    SHARED_COLUMNS = OPTION_CHAR + 'sharedColumns'
+    
+    CREATORS = 'creators'
+    CONTRIBUTORS = 'contributors'
+    
+    # legacy ePub2
+    COVERAGES = 'coverages'
+    RELATIONS = 'relations'
+    RIGHTS = 'rights'
+    SOURCES = 'sources'
+    TYPES = 'types'
+    
+    # ePub3
+    SERIES = 'series'
+    COLLECTIONS = 'collections'
+    TITLES = 'titles'
+    
+    @staticmethod
+    def find_plugin(key):
+        from calibre.customize.ui import find_plugin
+        return find_plugin(
+            ePubExtendedMetadata.name_writer if key == KEY.AUTO_EMBED else ePubExtendedMetadata.name_reader,
+        )
+    
+    @staticmethod
+    def enable_plugin(key):
+        from calibre.customize.ui import enable_plugin
+        p = KEY.find_plugin(key)
+        if p:
+            enable_plugin(p.name)
+    
+    @staticmethod
+    def disable_plugin(key):
+        from calibre.customize.ui import disable_plugin
+        p = KEY.find_plugin(key)
+        if p:
+            disable_plugin(p.name)
+    
+    @staticmethod
+    def get_current_columns():
+        return {name:ColumnInfo(metadata) for name, metadata in DYNAMIC[KEY.SHARED_COLUMNS].items()}
+    
+    @staticmethod
+    def get_current_prefs():
+        prefs = DYNAMIC.copy()
+        current_columns = KEY.get_current_columns().keys()
+        
+        prefs = {k:v for k, v in prefs.items() if not k.startswith(KEY.OPTION_CHAR)}
+        
+        if KEY.CONTRIBUTORS not in prefs or not prefs[KEY.CONTRIBUTORS]:
+            prefs[KEY.CONTRIBUTORS] = {}
+        if KEY.TITLES not in prefs or not prefs[KEY.TITLES]:
+            prefs[KEY.TITLES] = {}
+        
+        for k,v in copy.copy(prefs).items():
+            if k == KEY.CONTRIBUTORS:
+                for k,v in copy.copy(prefs[KEY.CONTRIBUTORS]).items():
+                    if not k or k not in CONTRIBUTORS_CODES or not v or v not in current_columns:
+                        prefs[KEY.CONTRIBUTORS].pop(k, None)
+            elif k == KEY.TITLES:
+                for k,v in copy.copy(prefs[KEY.TITLES]).items():
+                    if not v or v not in current_columns:
+                        prefs[KEY.TITLES].pop(k, None)
+            elif not v or v not in current_columns:
+                prefs.pop(k, None)
+        
+        if DYNAMIC[KEY.LINK_AUTHOR]:
+            prefs[KEY.CONTRIBUTORS][FIELD.AUTHOR.ROLE] = FIELD.AUTHOR.NAME
+        return prefs
+    
+    @staticmethod
+    def get_names():
+        from .common_utils.columns import get_names
+        return get_names(True)
+    
+    @staticmethod
+    def get_title():
+        from .common_utils.columns import get_title
+        return get_title(True)
+    
+    @staticmethod
+    def get_used_columns():
+        from .common_utils.columns import get_columns_where
+        PREFS = library_prefs()
+        treated_column = set()
+        treated_column.update(v for k,v in PREFS.items() if not k.startswith(KEY.OPTION_CHAR) and isinstance(v, str))
+        treated_column.update(c for c in PREFS[KEY.CONTRIBUTORS].values() if isinstance(c, str))
+        treated_column.update(c for c in PREFS[KEY.TITLES].values() if isinstance(c, str))
+        
+        def predicate(column):
+            return column.is_custom and column.name in treated_column
+        
+        return {v.name:v.metadata for v in get_columns_where(predicate=predicate).values()}
+
+
+DEFAULTS = {}
+DEFAULTS[KEY.AUTO_IMPORT] = False
+DEFAULTS[KEY.AUTO_EMBED] = False
+DEFAULTS[KEY.LINK_AUTHOR] = False
+DEFAULTS[KEY.CREATORS_AS_AUTHOR] = False
+DEFAULTS[KEY.CONTRIBUTORS] = {}
+DEFAULTS[KEY.FIRST_CONFIG] = True
+DEFAULTS[KEY.KEEP_CALIBRE_MANUAL] = False
+DEFAULTS[KEY.KEEP_CALIBRE_AUTO] = True
+DEFAULTS[KEY.TITLES] = {
+    FIELD.TITLES.SUBTITLE: '',
+    FIELD.TITLES.SHORT: '',
+    FIELD.TITLES.EDITION: '',
+    FIELD.TITLES.EXPANDED: '',
+    FIELD.TITLES.COLLECTION: '',
+}
+
+# the copy of the prefs of the current library, read by the workers
+DYNAMIC = JSONConfig('plugins/' + PLUGIN_NAME + '_dynamic')
+DYNAMIC.defaults = copy.deepcopy(DEFAULTS)
+DYNAMIC.defaults[KEY.SHARED_COLUMNS] = {}
+
+_PREFS = None
+
+
+def library_prefs():
+    '''
+    The prefs of the current library (PREFS), only available in the GUI
+    '''
+    global _PREFS
+    if _PREFS is None:
+        from .common_utils import PREFS_library
+        _PREFS = PREFS_library()
+        _PREFS.defaults.update(copy.deepcopy(DEFAULTS))
+    return _PREFS
+
+
+def __getattr__(name):
+    # PREFS is created on the first import, by the GUI
+    if name == 'PREFS':
+        return library_prefs()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+class PrefsSnapshot:
+    '''
+    The prefs resolved by KEY.get_current_prefs() against the columns of the library,
+    with the values of DYNAMIC used by the reading and the writing.
+    
+    Immutable, so it can be shared by all the books until update_current_prefs().
+    The KEY.CONTRIBUTORS and KEY.TITLES items give the former dict shape.
+    
+    Only plain data is pickled (the role -> column plan, the field metadata of the columns),
+    the ColumnInfo are built on the first use of columns.
+    '''
+    __slots__ = ('_columns', '_columns_metadata', 'contributors', 'keep_calibre_auto', 'keep_calibre_manual',
+                 'roles', 'title_types', 'titles')
+    
+    def __init__(self, contributors, titles, columns_metadata, keep_calibre_manual, keep_calibre_auto):
+        self.contributors = MappingProxyType(dict(contributors))
+        self.titles = MappingProxyType(dict(titles))
+        # {name:field metadata}
+        self._columns_metadata = dict(columns_metadata)
+        self._columns = None
+        # the roles and the title-types to extract, see extended_metadata.wanted_extended_metadata()
+        self.roles = frozenset(role for role, field in self.contributors.items() if field != FIELD.AUTHOR.NAME)
+        self.title_types = frozenset(self.titles.keys())
+        self.keep_calibre_manual = keep_calibre_manual
+        self.keep_calibre_auto = keep_calibre_auto
+    
+    @classmethod
+    def from_prefs(cls):
+        prefs = KEY.get_current_prefs()
+        return cls(
+            prefs[KEY.CONTRIBUTORS],
+            prefs[KEY.TITLES],
+            DYNAMIC[KEY.SHARED_COLUMNS],
+            DYNAMIC[KEY.KEEP_CALIBRE_MANUAL],
+            DYNAMIC[KEY.KEEP_CALIBRE_AUTO],
+        )
+    
+    @property
+    def columns(self):
+        '''
+        The ColumnInfo of the used columns {name:ColumnInfo}
+        '''
+        if self._columns is None:
+            self._columns = MappingProxyType(
+                {name:ColumnInfo(metadata) for name, metadata in self._columns_metadata.items()},
+            )
+        return self._columns
+    
+    def state(self):
+        '''
+        The arguments to rebuild the snapshot, only builtin types
+        '''
+        return (
+            dict(self.contributors), dict(self.titles), self._columns_metadata,
+            self.keep_calibre_manual, self.keep_calibre_auto,
+        )
+    
+    def __getitem__(self, key):
+        if key == KEY.CONTRIBUTORS:
+            return dict(self.contributors)
+        if key == KEY.TITLES:
+            return dict(self.titles)
+        raise KeyError(key)
+    
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def __reduce__(self):
+        return (PrefsSnapshot, self.state())
+    
+    def __repr__(self):
+        return f'{{{KEY.CONTRIBUTORS!r}: {dict(self.contributors)!r}, {KEY.TITLES!r}: {dict(self.titles)!r}}}'
+
+
+# The snapshot is written next to the JSON of DYNAMIC each time it is updated,
+# so the calibre workers (Add books, Embed) don't have to resolve the prefs and
+# rebuild the columns metadata themselves: a single small file read
+SNAPSHOT_VERSION = 2
+
+_CURRENT_PREFS = None
+
+
+def prefs_snapshot_path():
+    import os.path
+    
+    from calibre.constants import config_dir
+    return os.path.join(config_dir, 'plugins', PLUGIN_NAME + '_snapshot.pickle')
+
+
+def save_prefs_snapshot(snapshot):
+    import os
+    import pickle
+    path = prefs_snapshot_path()
+    tmp = path + '.tmp'
+    try:
+        with open(tmp, 'wb') as f:
+            # builtin types only, unpickling them never imports a module
+            pickle.dump((SNAPSHOT_VERSION, snapshot.state()), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except Exception as err:
+        debug_print('Failed to write the prefs snapshot:', err)
+        for p in (tmp, path):
+            # a stale snapshot is worse than none
+            try:
+                os.remove(p)
+            except OSError:
+                pass
+
+
+def load_prefs_snapshot():
+    '''
+    The PrefsSnapshot written by update_current_prefs(), or None if not usable
+    '''
+    import pickle
+    try:
+        with open(prefs_snapshot_path(), 'rb') as f:
+            version, state = pickle.load(f)
+        if version != SNAPSHOT_VERSION:
+            return None
+        return PrefsSnapshot(*state)
+    except Exception:
+        return None
+
+
+def current_prefs() -> PrefsSnapshot:
+    '''
+    The PrefsSnapshot of the current library, loaded or resolved once by process
+    '''
+    global _CURRENT_PREFS
+    if _CURRENT_PREFS is None:
+        _CURRENT_PREFS = load_prefs_snapshot() or PrefsSnapshot.from_prefs()
+    return _CURRENT_PREFS
+
+
+def update_current_prefs():
+    '''
+    Resolve again the prefs, for this process and for the workers
+    '''
+    global _CURRENT_PREFS
+    _CURRENT_PREFS = PrefsSnapshot.from_prefs()
+    save_prefs_snapshot(_CURRENT_PREFS)
+
+
+def plugin_check_enable_library():
+    PREFS = library_prefs()
+    if PREFS[KEY.AUTO_IMPORT]:
+        KEY.enable_plugin(KEY.AUTO_IMPORT)
+    else:
+        KEY.disable_plugin(KEY.AUTO_IMPORT)
+    
+    if PREFS[KEY.AUTO_EMBED]:
+        KEY.enable_plugin(KEY.AUTO_EMBED)
+    else:
+        KEY.disable_plugin(KEY.AUTO_EMBED)
+    
+    with DYNAMIC:
+        DYNAMIC.update(PREFS.copy())
+        DYNAMIC[KEY.SHARED_COLUMNS] = KEY.get_used_columns()
+    
+    # the prefs or the library have changed
+    update_current_prefs()
+
+
+def plugin_realy_enable(key):
+    from calibre.customize.ui import is_disabled
+    p = KEY.find_plugin(key)
+    if p:
+        enable = not is_disabled(p)
+        PREFS = library_prefs()
+        if PREFS[key] != enable:
+            PREFS[key] = enable
+        return enable
+    else:
+        return False
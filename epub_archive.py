@@ -0,0 +1,480 @@
+#!/usr/bin/env python
+
+__license__   = 'GPL v3'
+__copyright__ = '2021, un_pogaz <un.pogaz@gmail.com>'
+
+
+import os
+import struct
+import tempfile
+import time
+import zlib
+
+# Low level access to the members of a ePub through the central directory of the ZIP,
+# without going through a ZipFile that would index and check every members of the archive.
+
+ZIP_STORED = 0
+ZIP_DEFLATED = 8
+
+FLAG_ENCRYPTED = 0x1
+FLAG_UTF8 = 0x800
+
+# same layouts as the Python zipfile module
+_EOCD = struct.Struct('<4s4H2LH')
+_EOCD_SIG = b'PK\x05\x06'
+_EOCD_MAX_COMMENT = 0xFFFF
+_ZIP64_LOCATOR_SIZE = 20
+_ZIP64_LOCATOR_SIG = b'PK\x06\x07'
+
+_CENTRAL = struct.Struct('<4s4B4HL2L5H2L')
+_CENTRAL_SIG = b'PK\x01\x02'
+
+_LOCAL = struct.Struct('<4s2B4HL2L2H')
+_LOCAL_SIG = b'PK\x03\x04'
+
+FLAG_DATA_DESCRIPTOR = 0x8
+_DATA_DESCRIPTOR_SIG = b'PK\x07\x08'
+_DATA_DESCRIPTOR_SIZE = 12
+
+# size of the buffer used to copy the members
+COPY_BUFFER_SIZE = 64 * 1024
+# size of the compressed chunks decompressed at once by MemberReader
+READ_CHUNK_SIZE = 16 * 1024
+
+# extra field used to pad a local header (same id as zipalign)
+_PADDING = struct.Struct('<2H')
+_PADDING_ID = 0xD935
+_EXTRA_MAX = 0xFFFF
+# free space reserved after a rewritten member, for the next edits
+PADDING_RESERVE = 2048
+
+
+class ArchiveError(ValueError):
+    pass
+
+
+class MemberTooLarge(ArchiveError):
+    pass
+
+
+class ArchiveMember:
+    '''
+    A entry of the central directory
+    '''
+    __slots__ = (
+        'CRC', 'central', 'compress_size', 'compress_type', 'file_size', 'filename', 'flag_bits',
+        'header_offset', 'raw_comment', 'raw_extra', 'raw_name',
+    )
+    
+    def __init__(self, central, raw_name, raw_extra, raw_comment, concat=0):
+        # raw record of the central directory, rewritten as is
+        self.central = list(central)
+        self.raw_name = raw_name
+        self.raw_extra = raw_extra
+        self.raw_comment = raw_comment
+        
+        self.flag_bits = central[5]
+        self.compress_type = central[6]
+        self.CRC = central[9]
+        self.compress_size = central[10]
+        self.file_size = central[11]
+        self.header_offset = central[18] + concat
+        self.filename = raw_name.decode('utf-8' if self.flag_bits & FLAG_UTF8 else 'cp437')
+    
+    def central_record(self, concat=0):
+        central = list(self.central)
+        central[5] = self.flag_bits
+        central[6] = self.compress_type
+        central[9] = self.CRC
+        central[10] = self.compress_size
+        central[11] = self.file_size
+        central[12] = len(self.raw_name)
+        central[13] = len(self.raw_extra)
+        central[14] = len(self.raw_comment)
+        central[18] = self.header_offset - concat
+        return _CENTRAL.pack(*central) + self.raw_name + self.raw_extra + self.raw_comment
+    
+    def __repr__(self):
+        return f'<ArchiveMember {self.filename!r} offset={self.header_offset} size={self.compress_size}>'
+
+
+class MemberReader:
+    '''
+    Read a member chunk by chunk. The position of the stream is restored
+    before each chunk, so the stream can be used by others meanwhile.
+    
+    If limit is set, reading more than limit decompressed bytes raise a ArchiveError.
+    '''
+    def __init__(self, stream, member, data_offset, limit=None):
+        self.stream = stream
+        self.member = member
+        self.limit = limit
+        self._size = 0
+        self._offset = data_offset
+        self._remaining = member.compress_size
+        self._decompressor = None
+        if member.compress_type == ZIP_DEFLATED:
+            self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        self._buffer = b''
+        self._crc = 0
+        self._eof = False
+        self._checked = False
+    
+    def _fill(self):
+        if not self._remaining:
+            if self._decompressor:
+                self._buffer += self._decompress(self._decompressor.flush)
+                self._decompressor = None
+            self._eof = True
+            return
+        
+        self.stream.seek(self._offset)
+        chunk = self.stream.read(min(self._remaining, READ_CHUNK_SIZE))
+        if not chunk:
+            raise ArchiveError(f'Unexpected end of the archive in {self.member.filename!r}')
+        self._offset += len(chunk)
+        self._remaining -= len(chunk)
+        if self._decompressor:
+            chunk = self._decompress(self._decompressor.decompress, chunk)
+        self._buffer += chunk
+    
+    def _decompress(self, func, *args):
+        try:
+            return func(*args)
+        except zlib.error as err:
+            raise ArchiveError(f'Corrupted data for {self.member.filename!r}: {err}') from err
+    
+    def read(self, size=-1):
+        # once all the member is read, reach the end to check the CRC with this chunk
+        while not self._eof and (size is None or size < 0 or len(self._buffer) < size or not self._remaining):
+            self._fill()
+        
+        if size is None or size < 0:
+            data, self._buffer = self._buffer, b''
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        
+        self._size += len(data)
+        if self.limit is not None and self._size > self.limit:
+            raise MemberTooLarge(f'The member {self.member.filename!r} exceed the limit of {self.limit} bytes')
+        self._crc = zlib.crc32(data, self._crc)
+        if self._eof and not self._buffer and not self._checked:
+            # checked once, even when the last read returned the buffer exactly to its end
+            self._checked = True
+            if self._crc & 0xFFFFFFFF != self.member.CRC:
+                raise ArchiveError(f'Bad CRC-32 for {self.member.filename!r}')
+        return data
+    
+    def close(self):
+        self._buffer = b''
+        self._remaining = 0
+        self._decompressor = None
+        self._eof = True
+        self._checked = True
+
+
+class EPubArchive:
+    '''
+    Read the members of a ZIP stream using only its central directory.
+    The stream is not closed by the archive.
+    '''
+    def __init__(self, stream):
+        self.stream = stream
+        self.members = {}
+        self.concat = 0
+        self.cd_offset = 0
+        self.eocd = None
+        self.comment = b''
+        self._read_central_directory()
+    
+    def _read_central_directory(self):
+        stream = self.stream
+        stream.seek(0, os.SEEK_END)
+        size = stream.tell()
+        
+        tail_size = min(size, _EOCD.size + _EOCD_MAX_COMMENT)
+        stream.seek(size - tail_size)
+        tail = stream.read(tail_size)
+        pos = tail.rfind(_EOCD_SIG)
+        while pos >= 0 and len(tail) - pos < _EOCD.size:
+            pos = tail.rfind(_EOCD_SIG, 0, pos)
+        if pos < 0:
+            raise ArchiveError('End of central directory not found')
+        
+        eocd = _EOCD.unpack_from(tail, pos)
+        entries, cd_size, cd_offset = eocd[4], eocd[5], eocd[6]
+        if (
+            entries == 0xFFFF or cd_size == 0xFFFFFFFF or cd_offset == 0xFFFFFFFF
+            or tail[pos-_ZIP64_LOCATOR_SIZE:pos-_ZIP64_LOCATOR_SIZE+4] == _ZIP64_LOCATOR_SIG
+        ):
+            raise ArchiveError('ZIP64 archives are not supported')
+        
+        eocd_offset = size - tail_size + pos
+        # data prepended to the archive shift all the offsets
+        concat = eocd_offset - cd_size - cd_offset
+        if concat < 0:
+            raise ArchiveError('Invalid central directory offset')
+        
+        self.concat = concat
+        self.cd_offset = cd_offset + concat
+        self.eocd = list(eocd)
+        self.comment = tail[pos+_EOCD.size:pos+_EOCD.size+eocd[7]]
+        
+        stream.seek(self.cd_offset)
+        data = stream.read(cd_size)
+        if len(data) != cd_size:
+            raise ArchiveError('Truncated central directory')
+        
+        idx = 0
+        while idx < cd_size:
+            if data[idx:idx+4] != _CENTRAL_SIG:
+                raise ArchiveError('Bad magic number for central directory')
+            fields = _CENTRAL.unpack_from(data, idx)
+            idx += _CENTRAL.size
+            name_end = idx + fields[12]
+            extra_end = name_end + fields[13]
+            comment_end = extra_end + fields[14]
+            
+            member = ArchiveMember(
+                fields, data[idx:name_end], data[name_end:extra_end], data[extra_end:comment_end], concat,
+            )
+            if member.filename in self.members:
+                raise ArchiveError(f'Duplicate member {member.filename!r}')
+            self.members[member.filename] = member
+            idx = comment_end
+    
+    def namelist(self):
+        return list(self.members.keys())
+    
+    def getmember(self, name):
+        member = self.members.get(name)
+        if member is None:
+            # some tools don't respect the case of the paths
+            lower = name.lower()
+            for k,v in self.members.items():
+                if k.lower() == lower:
+                    return v
+            raise KeyError(f'There is no item named {name!r} in the archive')
+        return member
+    
+    def _data_offset(self, member):
+        self.stream.seek(member.header_offset)
+        header = self.stream.read(_LOCAL.size)
+        if len(header) != _LOCAL.size or header[:4] != _LOCAL_SIG:
+            raise ArchiveError(f'Bad magic number for file header of {member.filename!r}')
+        fields = _LOCAL.unpack(header)
+        return member.header_offset + _LOCAL.size + fields[10] + fields[11]
+    
+    def _record_end(self, member):
+        '''
+        Offset of the end of the member: local header, data and data descriptor
+        '''
+        end = self._data_offset(member) + member.compress_size
+        if member.flag_bits & FLAG_DATA_DESCRIPTOR:
+            self.stream.seek(end)
+            if self.stream.read(4) == _DATA_DESCRIPTOR_SIG:
+                end += 4
+            end += _DATA_DESCRIPTOR_SIZE
+        return end
+    
+    def _slot_ends(self):
+        '''
+        Offset of the next member (or of the central directory) for each member
+        '''
+        members = sorted(self.members.values(), key=lambda m: m.header_offset)
+        offsets = [m.header_offset for m in members[1:]] + [self.cd_offset]
+        return {m.filename:end for m, end in zip(members, offsets)}
+    
+    def _garbage_size(self, slot_ends, exclude=None):
+        '''
+        Space of the archive not used by any member (old slots left by replace()),
+        without the slot of exclude
+        '''
+        rslt = 0
+        for member in self.members.values():
+            if member is exclude:
+                continue
+            # the local header is only read if its extra field differ from the central one
+            # (padding) or if the data descriptor has no signature
+            end = member.header_offset + _LOCAL.size + len(member.raw_name) + len(member.raw_extra)
+            end += member.compress_size
+            if member.flag_bits & FLAG_DATA_DESCRIPTOR:
+                end += 4 + _DATA_DESCRIPTOR_SIZE
+            slot_end = slot_ends[member.filename]
+            if end != slot_end:
+                end = self._record_end(member)
+            rslt += slot_end - end
+        return rslt
+    
+    def _check_readable(self, member):
+        if member.flag_bits & FLAG_ENCRYPTED:
+            raise ArchiveError(f'The member {member.filename!r} is encrypted')
+        if member.compress_type not in (ZIP_STORED, ZIP_DEFLATED):
+            raise ArchiveError(f'Unsupported compression method {member.compress_type} for {member.filename!r}')
+    
+    def open(self, name, limit=None):
+        '''
+        Return a file-like object that decompress the member progressively
+        '''
+        member = self.getmember(name)
+        self._check_readable(member)
+        return MemberReader(self.stream, member, self._data_offset(member), limit=limit)
+    
+    def read(self, name):
+        '''
+        Decompress and return the bytes of the member
+        '''
+        member = self.getmember(name)
+        self._check_readable(member)
+        
+        self.stream.seek(self._data_offset(member))
+        raw = self.stream.read(member.compress_size)
+        if member.compress_type == ZIP_DEFLATED:
+            try:
+                data = zlib.decompressobj(-zlib.MAX_WBITS).decompress(raw)
+            except zlib.error as err:
+                raise ArchiveError(f'Corrupted data for {name!r}: {err}') from err
+        else:
+            data = raw
+        
+        if zlib.crc32(data) & 0xFFFFFFFF != member.CRC:
+            raise ArchiveError(f'Bad CRC-32 for {name!r}')
+        return data
+    
+    def replace(self, name, data):
+        '''
+        Replace the content of a member, without rewriting the others.
+        
+        The new member reuse the place of the old one when it fits (adjusting the padding),
+        else it's appended after the last member and only the central directory is rewritten.
+        The stream must be writable.
+        '''
+        member = self.getmember(name)
+        
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -zlib.MAX_WBITS)
+        compressed = compressor.compress(data) + compressor.flush()
+        
+        header_size = _LOCAL.size + len(member.raw_name)
+        slot_ends = self._slot_ends()
+        slot_end = slot_ends[member.filename]
+        padding = slot_end - member.header_offset - header_size - len(compressed)
+        rebuild = False
+        if padding == 0 or _PADDING.size <= padding <= _EXTRA_MAX:
+            offset = member.header_offset
+            cd_offset = self.cd_offset
+        else:
+            # space lost by the old slots, measured before the member is changed
+            garbage = self._garbage_size(slot_ends, exclude=member)
+            if slot_end == self.cd_offset:
+                # last member, it can grow over the central directory
+                offset = member.header_offset
+            else:
+                # don't fit, append it at the place of the central directory
+                offset = self.cd_offset
+                garbage += slot_end - member.header_offset
+            # too many space lost, compact the archive
+            rebuild = garbage * 4 > self.cd_offset - self.concat
+            padding = PADDING_RESERVE
+            cd_offset = offset + header_size + padding + len(compressed)
+        
+        member.flag_bits &= FLAG_UTF8
+        member.compress_type = ZIP_DEFLATED
+        member.CRC = zlib.crc32(data) & 0xFFFFFFFF
+        member.compress_size = len(compressed)
+        member.file_size = len(data)
+        member.central[7], member.central[8] = _dos_time()
+        
+        if rebuild:
+            self._rebuild(member, compressed)
+            return
+        
+        self.stream.seek(offset)
+        self.stream.write(self._local_header(member, padding))
+        self.stream.write(compressed)
+        member.header_offset = offset
+        
+        self._write_central_directory(cd_offset)
+    
+    def _local_header(self, member, padding=0):
+        extra = b''
+        if padding:
+            extra = _PADDING.pack(_PADDING_ID, padding - _PADDING.size) + bytes(padding - _PADDING.size)
+        header = _LOCAL.pack(
+            _LOCAL_SIG, max(member.central[3], 20), 0, member.flag_bits, member.compress_type,
+            member.central[7], member.central[8], member.CRC, member.compress_size, member.file_size,
+            len(member.raw_name), len(extra),
+        )
+        return header + member.raw_name + extra
+    
+    def _rebuild(self, replaced, compressed):
+        '''
+        Rewrite the whole archive without the unused space.
+        The members are copied as their raw compressed data, without decompressing them.
+        '''
+        buffer = bytearray(COPY_BUFFER_SIZE)
+        with tempfile.TemporaryFile() as tmp:
+            # data prepended to the archive
+            _copy_range(self.stream, tmp, 0, self.concat, buffer)
+            
+            ends = {}
+            for member in self.members.values():
+                if member is not replaced:
+                    ends[member.filename] = self._record_end(member)
+            
+            for member in sorted(self.members.values(), key=lambda m: m.header_offset):
+                offset = tmp.tell()
+                if member is replaced:
+                    tmp.write(self._local_header(member, PADDING_RESERVE))
+                    tmp.write(compressed)
+                else:
+                    _copy_range(self.stream, tmp, member.header_offset, ends[member.filename], buffer)
+                member.header_offset = offset
+            
+            self._write_central_directory(tmp.tell(), tmp)
+            
+            size = tmp.tell()
+            self.stream.seek(0)
+            _copy_range(tmp, self.stream, 0, size, buffer)
+            self.stream.truncate()
+            self.stream.flush()
+    
+    def _write_central_directory(self, cd_offset, stream=None):
+        if stream is None:
+            stream = self.stream
+        stream.seek(cd_offset)
+        cd_size = 0
+        for member in self.members.values():
+            record = member.central_record(self.concat)
+            stream.write(record)
+            cd_size += len(record)
+        
+        self.eocd[5] = cd_size
+        self.eocd[6] = cd_offset - self.concat
+        stream.write(_EOCD.pack(*self.eocd))
+        stream.write(self.comment)
+        stream.truncate()
+        stream.flush()
+        self.cd_offset = cd_offset
+
+
+def _copy_range(src, dst, start, end, buffer):
+    '''
+    Copy the bytes [start:end] of src at the current position of dst, using a fixed size buffer
+    '''
+    view = memoryview(buffer)
+    src.seek(start)
+    remaining = end - start
+    while remaining > 0:
+        size = src.readinto(view[:min(remaining, len(view))])
+        if not size:
+            raise ArchiveError('Unexpected end of the archive')
+        dst.write(view[:size])
+        remaining -= size
+
+
+def _dos_time(timestamp=None):
+    t = time.localtime(timestamp)
+    return (
+        t.tm_hour << 11 | t.tm_min << 5 | t.tm_sec // 2,
+        (t.tm_year - 1980) << 9 | t.tm_mon << 5 | t.tm_mday,
+    )
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+
+__license__   = 'GPL v3'
+__copyright__ = '2021, un_pogaz <un.pogaz@gmail.com>'
+
+
+try:
+    load_translations()
+except NameError:
+    pass  # load_translations() added in calibre 1.9
+
+from contextlib import suppress
+from typing import List
+
+from .container_extended_metadata import (
+    ExtendedMetadata,
+    check_name_memos,
+    read_extended_metadata,
+    write_extended_metadata,
+)
+from .core import FIELD, ColumnInfo, current_prefs, debug_print
+
+
+def apply_extended_metadata(miA, prefs, extended_metadata, keep_calibre=False, check_user_metadata={}) -> List[str]:
+    field_change = []
+    
+    if check_user_metadata:
+        # check if the Metadata object accepts those added
+        from calibre.ebooks.metadata import string_to_authors
+        
+        for k,cc in check_user_metadata.items():
+            if not k.startswith('#'):
+                continue
+            if not (cc.is_composite or cc.is_csp):
+                # cc is shared by all the books (PrefsSnapshot), set the values on a copy
+                metadata = dict(cc.metadata)
+                mc_metadata = miA.get_user_metadata(k, False)
+                if not mc_metadata:
+                    if cc.is_multiple:
+                        metadata['#value#'] = []
+                    else:
+                        metadata['#value#'] = None
+                    metadata['#extra#'] = None
+                    miA.set_user_metadata(k, metadata)
+                else:
+                    mc = ColumnInfo(mc_metadata)
+                    if cc.is_multiple and not mc.is_multiple:
+                        values = []
+                        if cc.is_names:
+                            values = string_to_authors(mc.metadata['#value#'])
+                        elif mc.metadata['#value#']:
+                            values = mc.metadata['#value#'].split(cc.is_multiple['ui_to_list'])
+                        
+                        metadata['#value#'] = values
+                        metadata['#extra#'] = None
+                        miA.set_user_metadata(k, metadata)
+                    
+                    if not cc.is_multiple and mc.is_multiple:
+                        join = mc.is_multiple.get('list_to_ui') or ', '
+                        value = join.join(mc.metadata['#value#'])
+                        
+                        metadata['#value#'] = value
+                        metadata['#extra#'] = None
+                        miA.set_user_metadata(k, metadata)
+    
+    extended_metadata = ExtendedMetadata.from_dict(extended_metadata)
+    contributors = extended_metadata.contributors
+    for role, field in prefs.contributors.items():
+        if field == FIELD.AUTHOR.NAME or role not in contributors:
+            continue
+        new_value = list(contributors[role])
+        old_value = miA.get(field)
+        if not (old_value and keep_calibre):
+            miA.set(field, new_value)
+            field_change.append(field)
+    
+    titles = extended_metadata.titles
+    # overwrite the calibre behavior that merge subtitle into main-title
+    # iff a subtitle field is defined
+    if FIELD.TITLES.READ in titles and prefs.titles.get(FIELD.TITLES.SUBTITLE):
+        if miA.get('title') == titles[FIELD.TITLES.READ]:
+            miA.set('title', titles[FIELD.TITLES.MAIN])
+            field_change.append('title')
+    
+    for role, field in prefs.titles.items():
+        if role not in titles:
+            continue
+        new_value = titles[role]
+        old_value = miA.get(field)
+        if not (old_value and keep_calibre):
+            miA.set(field, new_value)
+            field_change.append(field)
+    
+    return field_change
+
+
+def wanted_extended_metadata(prefs):
+    '''
+    The contributors roles and the title-types used by apply_extended_metadata() with these prefs
+    '''
+    return prefs.roles, prefs.title_types
+
+
+def create_extended_metadata(miA, prefs) -> ExtendedMetadata:
+    contributors = {}
+    titles = {}
+    
+    for role, field in prefs.contributors.items():
+        contributors[role] = miA.get(field, default=[])
+    
+    for role, field in prefs.titles.items():
+        titles[role] = miA.get(field, default=None)
+    
+    return ExtendedMetadata(contributors=contributors, titles=titles)
+
+
+####
+# Enter the exotic zone
+# those of the integrated plugins that if you don't watch out, overide those of Calibre => no basic metadata.
+
+#   get_metadata(stream, type)
+def read_metadata(stream, fmt, miA):
+    # ---------------
+    # Read Extended Metadata
+    check_name_memos()
+    prefs = current_prefs()
+    extended_metadata = read_extended_metadata(stream, *wanted_extended_metadata(prefs))
+    apply_extended_metadata(miA, prefs, extended_metadata,
+                        keep_calibre=prefs.keep_calibre_auto, check_user_metadata=prefs.columns)
+    return miA
+
+
+# ePubExtendedMetadata.MetadataWriter
+#   set_metadata(stream, mi, type)
+def write_metadata(stream, fmt, miA):
+    import sys
+    import traceback
+    
+    # ---------------
+    # Write Extended Metadata
+    from calibre.customize.builtins import ActionEmbed
+    from calibre.customize.ui import find_plugin
+    
+    i = None
+    book_ids = None
+    pd = None
+    only_fmts = None
+    errors = None
+    report_error = None
+    
+    action_embed = find_plugin(ActionEmbed.name).actual_plugin_
+    job_data = getattr(action_embed, 'job_data', None)
+    if action_embed and job_data:
+        with suppress(Exception):
+            i, book_ids, pd, only_fmts, errors = job_data
+            def report_error(mi, fmt, tb):
+                miA.book_id = book_ids[i]
+                errors.append((miA, fmt, tb))
+    
+    try:
+        check_name_memos()
+        extended_metadata = create_extended_metadata(miA, current_prefs())
+        write_extended_metadata(stream, extended_metadata, author_sort_map=getattr(miA, 'author_sort_map', None))
+    except:
+        if report_error is None:
+            debug_print(
+                'Failed to set extended metadata for the', fmt.upper(),
+                'format of:', getattr(miA, 'title', ''),
+                file=sys.stderr,
+            )
+            traceback.print_exc()
+        else:
+            report_error(miA, fmt.upper(), traceback.format_exc())
@@ -8,6 +8,24 @@ __copyright__ = '2021, un_pogaz <un.pogaz@gmail.com>'
 from calibre.customize import MetadataReaderPlugin
 
 
+def get_epub_metadata(stream, extract_cover=True):
+    '''
+    Same as calibre.ebooks.metadata.epub.get_metadata(), but return also
+    the calibre ZIP reader, with the OPF already parsed: (zip_reader, mi)
+    '''
+    from calibre.ebooks.metadata.epub import get_cover, get_zip_reader
+    
+    stream.seek(0)
+    reader = get_zip_reader(stream)
+    mi = reader.opf.to_book_metadata()
+    if extract_cover:
+        cdata = get_cover(reader.opf, reader.opf_path, stream, reader=reader)
+        if cdata is not None:
+            mi.cover_data = ('jpg', cdata)
+    mi.timestamp = None
+    return reader, mi
+
+
 class MetadataReader(MetadataReaderPlugin):
     '''
     A plugin that implements reading metadata from a set of file types.
@@ -27,6 +45,19 @@ class MetadataReader(MetadataReaderPlugin):
         from calibre.customize.builtins import EPUBMetadataReader
         from calibre.customize.ui import find_plugin, quick_metadata
         
+        if find_plugin(self.name) and hasattr(stream, 'seek'):
+            from ..container_extended_metadata import ContainerExtendedMetadata
+            from ..extended_metadata import read_metadata
+            try:
+                zip_reader, mi = get_epub_metadata(stream, extract_cover=not quick_metadata.quick)
+            except Exception:
+                # let the calibre reader raise or recover on its own
+                zip_reader = None
+            if zip_reader is not None:
+                # the ZIP opened and the OPF parsed for calibre are reused
+                container = ContainerExtendedMetadata(stream, read_only=True, zip_reader=zip_reader)
+                return read_metadata(container, type, mi)
+        
         # Use the Calibre EPUBMetadataReader
         if hasattr(stream, 'seek'):
             stream.seek(0)
@@ -37,7 +68,7 @@ class MetadataReader(MetadataReaderPlugin):
         if find_plugin(self.name):
             if hasattr(stream, 'seek'):
                 stream.seek(0)
-            from ..action import read_metadata
+            from ..extended_metadata import read_metadata
             return read_metadata(stream, type, mi)
         else:
             return mi
@@ -0,0 +1,17 @@
+#!/usr/bin/env python
+
+__license__   = 'GPL v3'
+__copyright__ = '2021, un_pogaz <un.pogaz@gmail.com>'
+
+
+# The root of the repository is the calibre plugin, its __init__.py imports calibre.
+# pytest would import it to set up the root as a package, it's collected as a plain
+# directory instead: the tests import the modules they need by themselves.
+# Loaded early with "-p conftest" (see pyproject.toml), before the root is collected.
+
+import pytest
+
+
+def pytest_collect_directory(path, parent):
+    if path == parent.config.rootpath:
+        return pytest.Dir.from_parent(parent, path=path)
@@ -0,0 +1,303 @@
+#!/usr/bin/env python
+
+__license__   = 'GPL v3'
+__copyright__ = '2021, un_pogaz <un.pogaz@gmail.com>'
+
+
+import importlib
+import importlib.util
+import io
+import os
+import sys
+import unittest
+import zipfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PLUGIN = 'epub_extended_metadata'
+
+OPF_PATH = 'OEBPS/content.opf'
+CONTAINER_XML = '''<?xml version="1.0"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles>
+    <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
+  </rootfiles>
+</container>'''
+
+OPF3 = '''<?xml version="1.0" encoding="utf-8"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
+  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
+    <dc:identifier id="uid">urn:uuid:0</dc:identifier>
+    <dc:title id="t1">The Main</dc:title>
+    <meta refines="#t1" property="title-type">main</meta>
+    <dc:title id="t2">A Sub</dc:title>
+    <meta refines="#t2" property="title-type">subtitle</meta>
+    <dc:creator id="c1">John Smith</dc:creator>
+    <meta refines="#c1" property="role" scheme="marc:relators">aut</meta>
+    <dc:contributor id="c2">Jane Doe</dc:contributor>
+    <meta refines="#c2" property="role" scheme="marc:relators">ill</meta>
+    <meta refines="#c2" property="role" scheme="marc:relators">trl</meta>
+    <meta refines="#c2" property="file-as">Doe, Jane (curated)</meta>
+    <dc:contributor id="c3">Kept Guy</dc:contributor>
+    <meta refines="#c3" property="role" scheme="marc:relators">edt</meta>
+    <meta refines="#c3" property="alternate-script" xml:lang="ja">キープ</meta>
+    <dc:contributor>No Role</dc:contributor>
+    <dc:rights>All rights reserved</dc:rights>
+    <meta property="belongs-to-collection" id="s1">The Saga</meta>
+    <meta refines="#s1" property="collection-type">series</meta>
+    <meta refines="#s1" property="group-position">2</meta>
+    <dc:language>en</dc:language>
+  </metadata>
+  <manifest><item id="x" href="x.html" media-type="application/xhtml+xml"/></manifest>
+  <spine><itemref idref="x"/></spine>
+</package>'''
+
+OPF2 = '''<?xml version="1.0" encoding="utf-8"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="2.0" unique-identifier="uid">
+  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:opf="http://www.idpf.org/2007/opf">
+    <dc:identifier id="uid">urn:uuid:0</dc:identifier>
+    <dc:title>The Title</dc:title>
+    <dc:creator opf:role="aut">Ann Author</dc:creator>
+    <dc:contributor opf:role="ill" opf:file-as="Doe, Jane (curated)">Jane Doe</dc:contributor>
+    <dc:contributor>Other Guy</dc:contributor>
+    <dc:source>The source</dc:source>
+    <dc:language>en</dc:language>
+  </metadata>
+  <manifest><item id="x" href="x.html" media-type="application/xhtml+xml"/></manifest>
+  <spine><itemref idref="x"/></spine>
+</package>'''
+
+# a OPF3 without "role" nor "title-type" in its <metadata>
+OPF3_PLAIN = '''<?xml version="1.0" encoding="utf-8"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
+  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
+    <dc:identifier id="uid">urn:uuid:0</dc:identifier>
+    <dc:title>The Title</dc:title>
+    <dc:creator>Ann Author</dc:creator>
+    <dc:language>en</dc:language>
+  </metadata>
+  <manifest><item id="x" href="x.html" media-type="application/xhtml+xml"/></manifest>
+  <spine><itemref idref="x"/></spine>
+</package>'''
+
+cem = None
+KEY = None
+
+
+def import_plugin_module(name):
+    '''
+    A module of the plugin, imported in a package like calibre does
+    (the modules use relative imports and the root __init__.py imports calibre)
+    '''
+    if PLUGIN not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            PLUGIN, os.path.join(ROOT, '__init__.py'), submodule_search_locations=[ROOT],
+        )
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[PLUGIN] = module
+        spec.loader.exec_module(module)
+    return importlib.import_module(f'{PLUGIN}.{name}')
+
+
+def setUpModule():
+    global cem, KEY
+    if importlib.util.find_spec('calibre') is None:
+        raise unittest.SkipTest('calibre is needed, run the tests with calibre-debug (see README.md)')
+    cem = import_plugin_module('container_extended_metadata')
+    KEY = import_plugin_module('core').KEY
+
+
+def make_epub(opf):
+    stream = io.BytesIO()
+    with zipfile.ZipFile(stream, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('mimetype', b'application/epub+zip', zipfile.ZIP_STORED)
+        zf.writestr('META-INF/container.xml', CONTAINER_XML)
+        zf.writestr(OPF_PATH, opf)
+        zf.writestr('OEBPS/x.html', '<html/>' * 1000)
+    return stream
+
+
+def read_opf(stream):
+    stream.seek(0)
+    with zipfile.ZipFile(stream) as zf:
+        return zf.read(OPF_PATH).decode('utf-8')
+
+
+def new_extended_metadata(contributors=None, titles=None):
+    return cem.ExtendedMetadata(contributors=contributors, titles=titles)
+
+
+class ReadExtendedMetadataTest(unittest.TestCase):
+    
+    def test_opf3(self):
+        em = cem.read_extended_metadata(make_epub(OPF3))
+        self.assertEqual(em.creators, ('John Smith',))
+        self.assertEqual(dict(em.contributors), {
+            'aut': ('John Smith',),
+            'ill': ('Jane Doe',),
+            'trl': ('Jane Doe',),
+            'edt': ('Kept Guy',),
+            'oth': ('No Role',),
+        })
+        self.assertEqual(em.titles['main'], 'The Main')
+        self.assertEqual(em.titles['subtitle'], 'A Sub')
+        self.assertEqual(em[KEY.RIGHTS], ['All rights reserved'])
+        self.assertEqual(em[KEY.SERIES], [('The Saga', '2')])
+        self.assertEqual(em[KEY.COLLECTIONS], [])
+    
+    def test_opf2(self):
+        em = cem.read_extended_metadata(make_epub(OPF2))
+        self.assertEqual(em.creators, ('Ann Author',))
+        self.assertEqual(dict(em.contributors), {
+            'aut': ('Ann Author',),
+            'ill': ('Jane Doe',),
+            'oth': ('Other Guy',),
+        })
+        self.assertEqual(dict(em.titles), {})
+        self.assertEqual(em[KEY.SOURCES], ['The source'])
+    
+    def test_filtered(self):
+        # a filtered read is the full read restricted to the wanted roles and title-types
+        stream = make_epub(OPF3)
+        full = cem.read_extended_metadata(stream)
+        for roles, title_types in (
+            ({'ill'}, set()),
+            ({'edt', 'oth'}, {'subtitle'}),
+            (None, {'subtitle'}),
+            ({'trl'}, None),
+            ({'pbl'}, set()),
+        ):
+            em = cem.read_extended_metadata(stream, roles, title_types)
+            expected = {r:n for r, n in full.contributors.items() if roles is None or r in roles}
+            self.assertEqual(dict(em.contributors), expected, (roles, title_types))
+            if title_types is None or 'subtitle' in title_types:
+                self.assertEqual(em.titles['subtitle'], 'A Sub')
+            else:
+                self.assertNotIn('subtitle', em.titles)
+            self.assertEqual(em.creators, ())
+    
+    def test_nothing_wanted(self):
+        em = cem.read_extended_metadata(make_epub(OPF3), set(), set())
+        self.assertEqual(em, cem.ExtendedMetadata())
+
+
+class WriteExtendedMetadataTest(unittest.TestCase):
+    
+    def test_round_trip(self):
+        for opf in (OPF3, OPF2):
+            stream = make_epub(opf)
+            new = new_extended_metadata({'ill': ['New Ill', 'Jane Doe'], 'pbl': ['A Publisher']})
+            self.assertTrue(cem.write_extended_metadata(stream, new))
+            em = cem.read_extended_metadata(stream)
+            self.assertEqual(em.contributors['ill'], ('New Ill', 'Jane Doe'))
+            self.assertEqual(em.contributors['pbl'], ('A Publisher',))
+            # the same values leave the file untouched
+            raw = stream.getvalue()
+            self.assertFalse(cem.write_extended_metadata(stream, new))
+            self.assertEqual(stream.getvalue(), raw)
+            with zipfile.ZipFile(stream) as zf:
+                self.assertIsNone(zf.testzip())
+    
+    def test_titles(self):
+        stream = make_epub(OPF3)
+        new = new_extended_metadata(titles={'subtitle': 'Another Sub', 'short': 'Shorty'})
+        self.assertTrue(cem.write_extended_metadata(stream, new))
+        em = cem.read_extended_metadata(stream)
+        self.assertEqual(em.titles['subtitle'], 'Another Sub')
+        self.assertEqual(em.titles['short'], 'Shorty')
+        self.assertEqual(em.titles['main'], 'The Main')
+    
+    def test_insert_keep_refines(self):
+        # a name added in front of the others: the existing contributors keep their ids and refines
+        stream = make_epub(OPF3)
+        new = new_extended_metadata({'ill': ['New Ill', 'Jane Doe'], 'edt': ['Someone', 'Kept Guy']})
+        self.assertTrue(cem.write_extended_metadata(stream, new))
+        opf = read_opf(stream)
+        self.assertIn('<dc:contributor id="c2">Jane Doe</dc:contributor>', opf)
+        self.assertIn('<meta refines="#c2" property="file-as">Doe, Jane (curated)</meta>', opf)
+        self.assertIn('<dc:contributor id="c3">Kept Guy</dc:contributor>', opf)
+        self.assertIn('property="alternate-script" xml:lang="ja">キープ</meta>', opf)
+        self.assertEqual(opf.count('>Jane Doe<'), 1)
+        em = cem.read_extended_metadata(stream)
+        self.assertEqual(em.contributors['ill'], ('New Ill', 'Jane Doe'))
+        self.assertEqual(em.contributors['trl'], ('Jane Doe',))
+        self.assertEqual(em.contributors['edt'], ('Someone', 'Kept Guy'))
+    
+    def test_reorder(self):
+        stream = make_epub(OPF3)
+        cem.write_extended_metadata(stream, new_extended_metadata({'ill': ['Jane Doe', 'Other']}))
+        new = new_extended_metadata({'ill': ['Other', 'Jane Doe']})
+        self.assertTrue(cem.write_extended_metadata(stream, new))
+        opf = read_opf(stream)
+        self.assertIn('<dc:contributor id="c2">Jane Doe</dc:contributor>', opf)
+        self.assertEqual(opf.count('>Jane Doe<'), 1)
+        self.assertEqual(cem.read_extended_metadata(stream).contributors['ill'], ('Other', 'Jane Doe'))
+    
+    def test_remove_role(self):
+        stream = make_epub(OPF3)
+        new = new_extended_metadata({'trl': [], 'edt': []})
+        self.assertTrue(cem.write_extended_metadata(stream, new))
+        opf = read_opf(stream)
+        # still illustrator
+        self.assertIn('<dc:contributor id="c2">Jane Doe</dc:contributor>', opf)
+        # without role, but with a alternate-script: kept
+        self.assertIn('<dc:contributor id="c3">Kept Guy</dc:contributor>', opf)
+        self.assertIn('property="alternate-script" xml:lang="ja">キープ</meta>', opf)
+        em = cem.read_extended_metadata(stream)
+        self.assertNotIn('trl', em.contributors)
+        self.assertNotIn('edt', em.contributors)
+        self.assertEqual(em.contributors['ill'], ('Jane Doe',))
+    
+    def test_author_sort_map(self):
+        sorts = {'Jane Doe': 'DOE, Jane', 'New Ill': 'ILL, New'}
+        stream = make_epub(OPF3)
+        new = new_extended_metadata({'ill': ['New Ill', 'Jane Doe']})
+        self.assertTrue(cem.write_extended_metadata(stream, new, author_sort_map=sorts))
+        opf = read_opf(stream)
+        self.assertIn('<meta refines="#c2" property="file-as">DOE, Jane</meta>', opf)
+        self.assertIn('property="file-as">ILL, New</meta>', opf)
+        
+        stream = make_epub(OPF2)
+        self.assertTrue(cem.write_extended_metadata(stream, cem.ExtendedMetadata(), author_sort_map=sorts))
+        self.assertIn('opf:file-as="DOE, Jane"', read_opf(stream))
+        self.assertFalse(cem.write_extended_metadata(stream, cem.ExtendedMetadata(), author_sort_map=sorts))
+
+
+class PrefilterExtendedMetadataTest(unittest.TestCase):
+    
+    def test_without_markers(self):
+        # nothing to extract for these roles and title-types: the OPF is not parsed
+        stream = make_epub(OPF3_PLAIN)
+        with cem.ContainerExtendedMetadata(stream, read_only=True) as container:
+            em = cem._prefilter_extended_metadata(container, {'ill', 'edt'}, {'short'})
+            self.assertIsNone(container._root)
+            self.assertEqual(em, cem._read_extended_metadata(container, {'ill', 'edt'}, {'short'}))
+        self.assertEqual(cem.read_extended_metadata(stream, {'ill', 'edt'}, {'short'}), em)
+    
+    def test_without_subtitle(self):
+        # without title-type, there is no subtitle (the main title is only found by parsing)
+        stream = make_epub(OPF3_PLAIN)
+        with cem.ContainerExtendedMetadata(stream, read_only=True) as container:
+            em = cem._prefilter_extended_metadata(container, {'ill'}, {'subtitle'})
+            self.assertIsNone(container._root)
+            full = cem._read_extended_metadata(container, {'ill'}, {'subtitle'})
+        self.assertEqual(dict(em.contributors), dict(full.contributors))
+        self.assertIsNone(em.titles['subtitle'])
+        self.assertIsNone(full.titles['subtitle'])
+    
+    def test_with_markers(self):
+        stream = make_epub(OPF3)
+        with cem.ContainerExtendedMetadata(stream, read_only=True) as container:
+            self.assertIsNone(cem._prefilter_extended_metadata(container, {'ill'}, set()))
+            self.assertIsNone(cem._prefilter_extended_metadata(container, set(), {'short'}))
+    
+    def test_not_filtered(self):
+        # the creators and the contributors without role are found only by parsing
+        stream = make_epub(OPF3_PLAIN)
+        with cem.ContainerExtendedMetadata(stream, read_only=True) as container:
+            self.assertIsNone(cem._prefilter_extended_metadata(container, {'aut'}, set()))
+            self.assertIsNone(cem._prefilter_extended_metadata(container, None, {'subtitle'}))
+        self.assertEqual(cem.read_extended_metadata(stream, {'aut'}, set()).contributors['aut'], ('Ann Author',))
+
+
+if __name__ == '__main__':
+    unittest.main()
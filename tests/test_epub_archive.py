@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+
+__license__   = 'GPL v3'
+__copyright__ = '2021, un_pogaz <un.pogaz@gmail.com>'
+
+
+import io
+import os
+import sys
+import unittest
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from epub_archive import ArchiveError, EPubArchive
+
+OPF = 'OEBPS/content.opf'
+
+
+def make_epub(members, prefix=b''):
+    '''
+    A ZIP written by zipfile, with the members (name, data) in this order
+    '''
+    stream = io.BytesIO()
+    with zipfile.ZipFile(stream, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('mimetype', b'application/epub+zip', zipfile.ZIP_STORED)
+        for name, data in members:
+            zf.writestr(name, data)
+    # like a self-extracting archive, the offsets don't count the prefix
+    return io.BytesIO(prefix + stream.getvalue())
+
+
+class EPubArchiveReplaceTest(unittest.TestCase):
+    
+    def check_archive(self, stream, expected):
+        # the archive must be valid for zipfile, with the same members and contents
+        stream.seek(0)
+        with zipfile.ZipFile(stream) as zf:
+            self.assertIsNone(zf.testzip())
+            self.assertEqual(zf.namelist(), ['mimetype', *(name for name, _ in expected)])
+            for name, data in expected:
+                self.assertEqual(zf.read(name), data)
+        # and for the archive itself, reopened from scratch
+        archive = EPubArchive(stream)
+        for name, data in expected:
+            self.assertEqual(archive.read(name), data)
+        return archive
+    
+    def test_in_place(self):
+        members = [(OPF, os.urandom(2000)), ('text.html', os.urandom(5000))]
+        stream = make_epub(members)
+        size = len(stream.getvalue())
+        archive = EPubArchive(stream)
+        offset = archive.getmember(OPF).header_offset
+        
+        members[0] = (OPF, os.urandom(1500))
+        archive.replace(OPF, members[0][1])
+        
+        archive = self.check_archive(stream, members)
+        self.assertEqual(archive.getmember(OPF).header_offset, offset)
+        self.assertEqual(len(stream.getvalue()), size)
+    
+    def test_append(self):
+        members = [(OPF, os.urandom(500)), ('text1.html', os.urandom(50000)), ('text2.html', os.urandom(50000))]
+        stream = make_epub(members)
+        archive = EPubArchive(stream)
+        
+        members[0] = (OPF, os.urandom(2000))
+        archive.replace(OPF, members[0][1])
+        
+        archive = self.check_archive(stream, members)
+        last = max(archive.members.values(), key=lambda m: m.header_offset)
+        self.assertEqual(last.filename, OPF)
+    
+    def test_last_member(self):
+        members = [('text.html', os.urandom(5000)), (OPF, os.urandom(500))]
+        stream = make_epub(members)
+        archive = EPubArchive(stream)
+        offset = archive.getmember(OPF).header_offset
+        
+        for size in (2000, 8000, 300):
+            members[1] = (OPF, os.urandom(size))
+            archive.replace(OPF, members[1][1])
+            archive = self.check_archive(stream, members)
+            self.assertEqual(archive.getmember(OPF).header_offset, offset)
+    
+    def test_rebuild(self):
+        members = [(OPF, os.urandom(20000)), ('text.html', os.urandom(1000))]
+        stream = make_epub(members)
+        archive = EPubArchive(stream)
+        offset = archive.getmember(OPF).header_offset
+        
+        # the old slot would be most of the archive, it's compacted instead of appended
+        members[0] = (OPF, os.urandom(30000))
+        archive.replace(OPF, members[0][1])
+        
+        archive = self.check_archive(stream, members)
+        self.assertEqual(archive.getmember(OPF).header_offset, offset)
+        self.assertEqual(archive._garbage_size(archive._slot_ends()), 0)
+    
+    def test_rebuild_after_append(self):
+        members = [(OPF, os.urandom(4000)), ('text.html', os.urandom(14000))]
+        stream = make_epub(members)
+        
+        # the OPF become the last member, its old slot is kept
+        members[0] = (OPF, os.urandom(6000))
+        EPubArchive(stream).replace(OPF, members[0][1])
+        archive = self.check_archive(stream, members)
+        self.assertGreater(archive._garbage_size(archive._slot_ends()), 4000)
+        
+        # then the old slots are compacted
+        members[1] = ('text.html', os.urandom(16000))
+        archive.replace('text.html', members[1][1])
+        archive = self.check_archive(stream, members)
+        self.assertEqual(archive._garbage_size(archive._slot_ends()), 0)
+    
+    def test_prepended_data(self):
+        prefix = b'#!/bin/sh\nexit 0\n' * 10
+        members = [(OPF, os.urandom(500)), ('text.html', os.urandom(5000))]
+        for size in (400, 2000, 40000):
+            stream = make_epub(members, prefix)
+            archive = EPubArchive(stream)
+            self.assertEqual(archive.concat, len(prefix))
+            
+            new_members = [(OPF, os.urandom(size)), members[1]]
+            archive.replace(OPF, new_members[0][1])
+            
+            self.check_archive(stream, new_members)
+            self.assertTrue(stream.getvalue().startswith(prefix))
+    
+    def test_corrupted_member(self):
+        stream = make_epub([(OPF, b'<package>' * 100)])
+        archive = EPubArchive(stream)
+        member = archive.getmember(OPF)
+        data = bytearray(stream.getvalue())
+        start = archive._data_offset(member)
+        data[start:start+member.compress_size] = b'\xff' * member.compress_size
+        
+        archive = EPubArchive(io.BytesIO(bytes(data)))
+        with self.assertRaises(ArchiveError):
+            archive.read(OPF)
+        with self.assertRaises(ArchiveError):
+            archive.open(OPF).read()
+    
+    def test_corrupted_crc(self):
+        # a stored member read exactly to its end must still check its CRC
+        data = os.urandom(16384)
+        stream = io.BytesIO()
+        with zipfile.ZipFile(stream, 'w', zipfile.ZIP_STORED) as zf:
+            zf.writestr(OPF, data)
+        archive = EPubArchive(stream)
+        member = archive.getmember(OPF)
+        self.assertEqual(archive.open(OPF).read(16384), data)
+        
+        member.CRC ^= 1
+        with self.assertRaises(ArchiveError):
+            archive.open(OPF).read(16384)
+        reader = archive.open(OPF)
+        with self.assertRaises(ArchiveError):
+            while reader.read(4096):
+                pass
+
+
+if __name__ == '__main__':
+    unittest.main()
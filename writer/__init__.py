@@ -27,6 +27,14 @@ class MetadataWriter(MetadataWriterPlugin):
         from calibre.customize.builtins import EPUBMetadataWriter
         from calibre.customize.ui import apply_null_metadata, config, find_plugin, force_identifiers
         
+        # Write the Extended Metadata first: only the OPF is patched inside the archive,
+        # so the Calibre EPUBMetadataWriter that follow do the one and only rewrite of the ePub
+        if find_plugin(self.name):
+            if hasattr(stream, 'seek'):
+                stream.seek(0)
+            from ..extended_metadata import write_metadata
+            write_metadata(stream, type, mi)
+        
         # Use the Calibre EPUBMetadataWriter
         if hasattr(stream, 'seek'):
             stream.seek(0)
@@ -35,12 +43,6 @@ class MetadataWriter(MetadataWriterPlugin):
         calibre_writer.force_identifiers = force_identifiers.force_identifiers
         calibre_writer.site_customization = config['plugin_customization'].get(calibre_writer.name, '')
         calibre_writer.set_metadata(stream, mi, type)
-        
-        if find_plugin(self.name):
-            if hasattr(stream, 'seek'):
-                stream.seek(0)
-            from ..action import write_metadata
-            write_metadata(stream, type, mi)
     
     def is_customizable(self):
         '''